@@ -47,6 +47,7 @@ DOC_DEPS = [
 OPTIONAL_DEPS = [
     "networkx",
     "pygraphviz",
+    "ruamel.yaml.clib",  # C-based YAML parsing, used by ruamel.yaml if found
 ]
 
 
@@ -102,7 +102,22 @@ def delay():
 
 
 @pytest.fixture
-def tmp_cfg_dir(tmpdir):
+def tmp_cache_dir(tmpdir_factory, monkeypatch) -> str:
+    """Redirects the cache directory of the CLI to a temporary directory, such
+    that tests do not write to the actual cache directory of the user"""
+    import utopya_cli._shared
+    import utopya_cli.models._ls
+
+    cache_dir = str(tmpdir_factory.mktemp("cache"))
+    monkeypatch.setattr(utopya_cli._shared, "UTOPYA_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(
+        utopya_cli.models._ls, "LS_CACHE_DIR", os.path.join(cache_dir, "ls")
+    )
+    return cache_dir
+
+
+@pytest.fixture
+def tmp_cfg_dir(tmpdir, tmp_cache_dir):
     """Adjust the config directory and paths to be something temporary and
     clean it up again afterwards...
 
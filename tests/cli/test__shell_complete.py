@@ -83,3 +83,19 @@ def test_complete_run_dirs(with_test_models, tmp_output_dir):
     ][0]
     # assert os.path.basename(run_dir) not in c1 # FIXME test has wrong out_dir
     assert os.path.basename(run_dir) in c2
+
+    # Only matching directories are suggested, most recent first
+    prefix = os.path.basename(run_dir)[:-3]
+    c3 = complete(ctx, None, prefix, extra_search_dirs=[str(tmp_output_dir)])
+    assert os.path.basename(run_dir) in c3
+    assert all(p.startswith(prefix) for p in c3)
+    assert c2 == sorted(c2, reverse=True)
+    assert not complete(
+        ctx, None, "~", extra_search_dirs=[str(tmp_output_dir)]
+    )
+
+    # The number of suggestions can be limited
+    c4 = complete(
+        ctx, None, "", extra_search_dirs=[str(tmp_output_dir)], max_num=1
+    )
+    assert c4 == c2[:1]
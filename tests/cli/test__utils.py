@@ -0,0 +1,143 @@
+"""Tests the utility functions of the CLI"""
+
+import os
+import pickle
+
+import pytest
+
+import utopya_cli._utils
+from utopya.yaml import write_yml
+from utopya_cli._utils import Echo, load_yml_cached
+
+# -----------------------------------------------------------------------------
+
+
+def test_load_yml_cached(tmpdir):
+    """Tests the on-disk caching of loaded YAML files"""
+    cache_dir = str(tmpdir.join("cache"))
+    path = str(tmpdir.join("manifest.yml"))
+    write_yml(dict(model_name="foo", paths=dict(executable="bar")), path=path)
+
+    # First load populates the cache
+    d1 = load_yml_cached(path, cache_dir=cache_dir)
+    assert d1 == dict(model_name="foo", paths=dict(executable="bar"))
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Second load uses it; the returned objects are independent of each other
+    d1.pop("model_name")
+    d2 = load_yml_cached(path, cache_dir=cache_dir)
+    assert d2["model_name"] == "foo"
+    assert d2 is not d1
+
+    # Changing the file invalidates the cache
+    write_yml(dict(model_name="spam"), path=path)
+    os.utime(path, ns=(0, 0))
+    assert load_yml_cached(path, cache_dir=cache_dir) == dict(
+        model_name="spam"
+    )
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Within the same process, loaded data is also kept in memory, such that
+    # the cache file need not be read again
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    os.remove(cache_file)
+    d3 = load_yml_cached(path, cache_dir=cache_dir)
+    assert d3 == dict(model_name="spam")
+    assert not os.listdir(cache_dir)
+
+    # ... again returning independent objects
+    d3.pop("model_name")
+    assert load_yml_cached(path, cache_dir=cache_dir) == dict(
+        model_name="spam"
+    )
+
+    # The in-memory cache is bounded
+    utopya_cli._utils._LOADED_YML.clear()
+    for i in range(utopya_cli._utils._LOADED_YML_MAX_SIZE + 3):
+        utopya_cli._utils._remember_yml(("some/path", i, 0), dict())
+    assert (
+        len(utopya_cli._utils._LOADED_YML)
+        == utopya_cli._utils._LOADED_YML_MAX_SIZE
+    )
+    assert ("some/path", 0, 0) not in utopya_cli._utils._LOADED_YML
+    utopya_cli._utils._LOADED_YML.clear()
+
+    # A corrupt cache file is ignored and overwritten
+    load_yml_cached(path, cache_dir=cache_dir)
+    utopya_cli._utils._LOADED_YML.clear()
+    with open(cache_file, "w") as f:
+        f.write("not a pickle")
+    assert load_yml_cached(path, cache_dir=cache_dir) == dict(
+        model_name="spam"
+    )
+
+    # Missing files raise
+    with pytest.raises(FileNotFoundError):
+        load_yml_cached(str(tmpdir.join("missing.yml")), cache_dir=cache_dir)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires POSIX")
+def test_load_yml_cached_private_dir(tmpdir):
+    """Tests that pickled cache files are only used from private directories"""
+    path = str(tmpdir.join("manifest.yml"))
+    write_yml(dict(model_name="foo"), path=path)
+
+    # The cache directory is created such that only the user can access it
+    cache_dir = str(tmpdir.join("cache"))
+    assert load_yml_cached(path, cache_dir=cache_dir) == dict(model_name="foo")
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A cache directory that others can write to is neither read nor written
+    shared_dir = str(tmpdir.join("shared_cache"))
+    os.makedirs(shared_dir)
+    os.chmod(shared_dir, 0o777)
+    cache_file = os.path.join(shared_dir, os.listdir(cache_dir)[0])
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with open(cache_file, "wb") as f:
+        pickle.dump((key, dict(model_name="evil")), f)
+
+    utopya_cli._utils._LOADED_YML.clear()
+    assert load_yml_cached(path, cache_dir=shared_dir) == dict(
+        model_name="foo"
+    )
+    assert os.listdir(shared_dir) == [os.path.basename(cache_file)]
+    with open(cache_file, "rb") as f:
+        assert pickle.load(f)[1] == dict(model_name="evil")
+
+
+def test_Echo_buffered(capsys):
+    """Tests buffered output of the Echo class"""
+    with Echo.buffered(flush_every=3):
+        Echo.info("foo")
+        Echo.note("bar")
+        assert capsys.readouterr().out == ""
+
+        # Reaching the flush interval writes out the buffer
+        Echo.remark("baz")
+        assert capsys.readouterr().out.split() == ["foo", "bar", "baz"]
+
+        # Nested contexts have no effect; echo arguments lead to a flush
+        with Echo.buffered(flush_every=1000):
+            Echo.info("spam")
+            assert capsys.readouterr().out == ""
+
+            Echo.info("eggs", nl=False)
+            assert capsys.readouterr().out == "spam\neggs"
+
+        Echo.info("remaining")
+        assert capsys.readouterr().out == ""
+
+    # Remaining messages are written upon exit, also on errors
+    assert capsys.readouterr().out == "remaining\n"
+
+    with pytest.raises(RuntimeError):
+        with Echo.buffered():
+            Echo.error("failed")
+            raise RuntimeError()
+    assert "failed" in capsys.readouterr().out
+
+    # Not buffering anymore
+    Echo.info("foo")
+    assert capsys.readouterr().out == "foo\n"
@@ -7,7 +7,7 @@ import pytest
 from utopya.cfg import get_cfg_path, load_from_cfg_dir
 from utopya_cli._utils import set_entries_from_kv_pairs
 
-from ..test_cfg import tmp_cfg_dir
+from ..test_cfg import tmp_cache_dir, tmp_cfg_dir
 from . import invoke_cli
 
 # -----------------------------------------------------------------------------
@@ -15,12 +15,38 @@ from . import invoke_cli
 # -----------------------------------------------------------------------------
 
 
-def test_list(with_test_models):
+def test_lazy_subcommands():
+    """Tests that the lazily loaded subcommands are all available"""
+    import click
+
+    from utopya_cli.models import models
+
+    for group, expected in (
+        (models, ("ls", "rm", "edit", "set-default", "info", "copy")),
+        (models.get_command(None, "register"), ("single", "from-list")),
+    ):
+        names = group.list_commands(None)
+        assert all(name in names for name in expected)
+
+        for name in names:
+            cmd = group.get_command(None, name)
+            assert isinstance(cmd, click.Command)
+            assert cmd.name == name
+
+    # Help output is available for all of them
+    res = invoke_cli(("models", "--help"))
+    assert res.exit_code == 0
+    assert "set-default" in res.output
+    assert "register" in res.output
+
+
+def test_list(with_test_models, tmp_cache_dir):
     """Tests utopya models ls"""
     # Lists models as expected
     res = invoke_cli(("models", "ls"))
     assert "model registry" in res.output
     assert DUMMY_MODEL in res.output
+    res_short = res
 
     # Also shows the number of bundles available in "long" mode
     res = invoke_cli(("models", "ls", "--long"))
@@ -30,6 +56,24 @@ def test_list(with_test_models):
 
     assert res.output == invoke_cli(("models", "ls", "-l")).output
 
+    # Output is cached, but the cache is invalidated upon registry changes
+    cache_files = os.listdir(os.path.join(tmp_cache_dir, "ls"))
+    assert len(cache_files) == 2
+    assert sum(f.startswith("long_") for f in cache_files) == 1
+    assert invoke_cli(("models", "ls")).output == res_short.output
+
+    new_model = f"_LsCacheTest_{DUMMY_MODEL}"
+    utopya.MODELS.register_model_info(new_model)
+    try:
+        assert new_model in invoke_cli(("models", "ls")).output
+        assert new_model in invoke_cli(("models", "ls", "-l")).output
+
+    finally:
+        utopya.MODELS.remove_entry(new_model)
+
+    assert new_model not in invoke_cli(("models", "ls")).output
+    assert invoke_cli(("models", "ls")).output == res_short.output
+
 
 def test_register_single(registry):
     """Tests utopya models register single"""
@@ -50,6 +94,15 @@ def test_register_single(registry):
     assert "Registration failed!" in res.output
     assert "Bundle validation failed" in res.output
 
+    # With a new label, it works; relative paths are resolved by the bundle
+    reg_args = reg_args[:-4] + ("--label", f"{TEST_LABEL}_new")
+    res = invoke_cli(reg_args + ("--source-dir", "./"))
+    print(res.output)
+    assert res.exit_code == 0
+
+    bundle = utopya.MODELS[DUMMY_MODEL][f"{TEST_LABEL}_new"]
+    assert bundle.paths["source_dir"] == os.path.realpath("./")
+
 
 def test_register_from_list(registry):
     """Tests utopya models register single
@@ -116,6 +169,23 @@ def test_register_from_list(registry):
     assert res.exit_code != 0
     assert "mutually exclusive" in res.output
 
+    # ... detected at parse time, regardless of the order of arguments
+    res = invoke_cli(
+        (
+            "models",
+            "register",
+            "from-list",
+            DUMMY_MODEL,
+            "--executables",
+            "'foo;bar'",
+            "--executable-fstr",
+            "{model_name}.py",
+        )
+    )
+    print(res.output)
+    assert res.exit_code == 2
+    assert "mutually exclusive" in res.output
+
     # Missing arguments
     reg_args = (
         "models",
@@ -143,6 +213,26 @@ def test_register_from_list(registry):
     assert "Mismatch of sequence lengths" in res.output
 
 
+def test_evaluate_fstr_for_list():
+    """Tests the format string evaluation used in register from-list"""
+    from utopya_cli.models._register_from_list import _evaluate_fstr_for_list
+
+    names = ["foo", "Bar"]
+    for fstr in (
+        "some/{model_name}/path/{model_name}.py",
+        "{{escaped}}/{model_name}",
+        "{model_name!r}:{model_name:>5}",
+        "no_fields",
+    ):
+        expected = [fstr.format(model_name=m) for m in names]
+        assert (
+            _evaluate_fstr_for_list(fstr=fstr, model_names=names) == expected
+        )
+
+    with pytest.raises(KeyError, match="bad_key"):
+        _evaluate_fstr_for_list(fstr="{bad_key}", model_names=names)
+
+
 def test_register_from_manifest(registry):
     """Tests utopya models register from-manifest"""
 
@@ -162,6 +252,35 @@ def test_register_from_manifest(registry):
     assert res.exit_code == 0
     assert "from_manifest_file" in res.output
 
+    # Already registered manifest files are not parsed again when skipping,
+    # if the label is known
+    skip_args = ("--exists-action", "skip", "--label", "from_manifest_file")
+    res = invoke_cli(reg_args + skip_args)
+    print(res.output)
+    assert res.exit_code == 0
+    assert "Skipping already registered manifest file" in res.output
+    assert "already registered" in res.output
+
+    # ... otherwise, the manifest file may define another label and is parsed
+    res = invoke_cli(reg_args + ("--exists-action", "skip"))
+    print(res.output)
+    assert res.exit_code == 0
+    assert "Skipping already registered manifest file" not in res.output
+    assert list(registry[DUMMY_MODEL].keys()) == ["from_manifest_file"]
+
+    res = invoke_cli(reg_args + ("--exists-action", "skip", "--label", "foo"))
+    print(res.output)
+    assert res.exit_code == 0
+    assert "Skipping" not in res.output
+    registry[DUMMY_MODEL].pop("foo")
+
+    # Only shows the registered info bundle in verbose mode
+    assert "paths:" not in res.output
+    res = invoke_cli(reg_args + ("--verbose",))
+    print(res.output)
+    assert res.exit_code == 0
+    assert "paths:" in res.output
+
     # With custom label
     extd_reg_args = reg_args + ("--label", "custom_label")
     res = invoke_cli(extd_reg_args)
@@ -179,6 +298,13 @@ def test_register_from_manifest(registry):
     assert "custom_label" in registry["MyCustomModelName"]
     registry.remove_entry("MyCustomModelName")
 
+    # Missing manifest files lead to an error
+    res = invoke_cli(reg_args[:3] + (DUMMY_INFO + ".missing",))
+    print(res.output)
+    assert res.exit_code == 1
+    assert "Loading manifest files failed" in res.output
+    assert "FileNotFoundError" in res.output
+
     # Custom model name fails with more than one manifest file
     res = invoke_cli(extd_reg_args + (DUMMY_INFO,))
     print(res.output)
@@ -186,6 +312,39 @@ def test_register_from_manifest(registry):
     assert "can only be specified if only a single manifest file" in res.output
 
 
+def test_load_manifests(tmp_cache_dir):
+    """Tests the loading of manifest files"""
+    from utopya_cli._utils import _LOADED_YML
+    from utopya_cli.models._register_from_manifest import _load_manifests
+
+    manifest_files = [
+        os.path.join(DEMO_DIR, "models", name, f"{name}_info.yml")
+        for name in ("MinimalModel", "ExtendedModel", "EvalOnlyModel")
+    ]
+    manifests = _load_manifests(manifest_files)
+    assert [m["model_name"] for m in manifests] == [
+        "MinimalModel",
+        "ExtendedModel",
+        "EvalOnlyModel",
+    ]
+
+    # They were loaded in this process and are thus cached in memory
+    cached_paths = [key[0] for key in _LOADED_YML]
+    assert all(f in cached_paths for f in manifest_files)
+    assert _load_manifests(manifest_files) == manifests
+
+
+def test_peek_model_name():
+    """Tests deducing the model name from a manifest file name"""
+    from utopya_cli.models._register_from_manifest import _peek_model_name
+
+    assert _peek_model_name("/foo/bar/MyModel_info.yml") == "MyModel"
+    assert _peek_model_name("MyModel_info.yml") == "MyModel"
+    assert _peek_model_name("/foo/_info.yml") is None
+    assert _peek_model_name("/foo/MyModel.yml") is None
+    assert _peek_model_name("/foo/MyModel_info.yaml") is None
+
+
 def test_remove(registry):
     """Tests utopya models rm
 
@@ -222,6 +381,10 @@ def test_remove(registry):
     assert labels[1] in registry[DUMMY_MODEL]
     assert labels[2] in registry[DUMMY_MODEL]
 
+    # Removing it again fails
+    res = invoke_cli(("models", "rm", DUMMY_MODEL, "--label", labels[0]))
+    assert res.exit_code == 1
+
     # ... with prompt for bundle name
     res = invoke_cli(("models", "rm", DUMMY_MODEL), input=f"{labels[1]}\n")
     assert res.exit_code == 0
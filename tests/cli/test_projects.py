@@ -8,7 +8,7 @@ import utopya
 from utopya import PROJECTS
 
 from .. import DEMO_DIR, TEST_PROJECT_NAME, get_cfg_fpath
-from ..test_model_registry import tmp_cfg_dir, tmp_projects
+from ..test_model_registry import tmp_cache_dir, tmp_cfg_dir, tmp_projects
 from . import invoke_cli
 
 VALID_INFO_FILE = get_cfg_fpath("project_info.yml")
@@ -17,6 +17,31 @@ INVALID_INFO_FILE = get_cfg_fpath("project_info_invalid.yml")
 # -----------------------------------------------------------------------------
 
 
+def test_lazy_subcommands():
+    """Tests that the lazily loaded subcommands are all available, both of
+    the projects command group and the top-level CLI"""
+    import click
+
+    from utopya_cli import cli
+    from utopya_cli.projects import projects
+
+    for group, expected in (
+        (projects, ("ls", "edit", "rm", "register")),
+        (cli, ("run", "run-existing", "eval", "test", "models", "projects")),
+    ):
+        names = group.list_commands(None)
+        assert all(name in names for name in expected)
+
+        for name in names:
+            cmd = group.get_command(None, name)
+            assert isinstance(cmd, click.Command)
+            assert cmd.name == name
+
+    res = invoke_cli(("projects", "--help"))
+    assert res.exit_code == 0
+    assert "register" in res.output
+
+
 def test_list(tmp_projects):
     """Tests utopya projects ls"""
     # Lists projects as expected
@@ -30,6 +55,9 @@ def test_list(tmp_projects):
     assert "metadata" in res.output
     assert "paths" in res.output
 
+    # ... but skips unset entries
+    assert " : None" not in res.output
+
     assert res.output == invoke_cli(("projects", "ls", "-l")).output
 
 
@@ -78,6 +106,35 @@ def test_remove(tmp_projects):
     assert TEST_PROJECT_NAME not in PROJECTS
 
 
+def test_register_without_models_dir(tmp_projects, tmpdir, monkeypatch):
+    """Registering a project without a models directory alongside its models
+    does not pick up manifest files from elsewhere"""
+    from utopya import MODELS
+
+    project_dir = tmpdir.mkdir("project")
+    project_dir.join(".utopya-project.yml").write(
+        "project_name: _utopyaTestProjectWithoutModelsDir\n"
+        "paths: {}\n"
+        "metadata: {}\n"
+    )
+
+    # A manifest file that would be found if the current working directory
+    # were scanned instead
+    model_dir = tmpdir.mkdir("cwd").mkdir("SomeStrayModel")
+    model_dir.join("SomeStrayModel_info.yml").write(
+        "model_name: SomeStrayModel\npaths: {}\n"
+    )
+    monkeypatch.chdir(tmpdir.join("cwd"))
+
+    res = invoke_cli(
+        ("projects", "register", str(project_dir), "--with-models")
+    )
+    print(res.output)
+    assert res.exit_code == 0
+    assert "defines no models directory" in res.output
+    assert "SomeStrayModel" not in MODELS
+
+
 def test_register(tmp_projects):
     """Tests utopya project register"""
     assert TEST_PROJECT_NAME in PROJECTS
@@ -159,7 +216,8 @@ def test_register(tmp_projects):
         + ("--custom-name", "some_custom_name", "--require-matching-names")
     )
     print(res.output)
-    assert res.exit_code != 0
+    assert res.exit_code == 1
+    assert not isinstance(res.exception, ValueError)  # not re-raised
     assert f"does not match the name given in the project info" in res.output
 
     # Missing info file
@@ -174,6 +232,15 @@ def test_register(tmp_projects):
     print(res.output)
     assert res.exit_code == 0
     assert "and 3 accompanying model(s)" in res.output
+    assert "eval_after_run" not in res.output
+
+    # ... optionally showing the registered info bundles
+    res = invoke_cli(
+        reg_args + ("--exists-action", "overwrite", "--with-models", "-v")
+    )
+    print(res.output)
+    assert res.exit_code == 0
+    assert "eval_after_run" in res.output
 
     # --- Use different files to test overwriting, updating, validating
     # Validation failure
@@ -224,3 +291,24 @@ def test_register(tmp_projects):
     assert res.exit_code != 0
     assert "1 validation error" in res.output
     assert "Extra inputs are not permitted" in res.output
+
+
+def test_find_manifests(tmpdir):
+    """Tests the search for model manifest files in a models directory"""
+    from utopya_cli.projects._register import _find_manifests
+
+    for fpath in (
+        "Foo/Foo_info.yml",
+        "Bar/Bar_info.yml",
+        "Bar/Bar_cfg.yml",
+        "Top_info.yml",  # not in a model directory
+        "Baz/nested/Baz_info.yml",  # too deep
+        ".Hidden/Hidden_info.yml",  # hidden directory
+        "Spam/.Spam_info.yml",  # hidden file
+    ):
+        tmpdir.join(fpath).ensure()
+
+    assert _find_manifests(str(tmpdir)) == [
+        str(tmpdir.join("Bar/Bar_info.yml")),
+        str(tmpdir.join("Foo/Foo_info.yml")),
+    ]
@@ -63,6 +63,20 @@ def test_run(with_test_models, tmp_output_dir):
     assert "Updates to meta configuration" in res.output
     assert "ABCXYZ" in res.output
 
+    # Metric suffixes are parsed already by the CLI
+    # NOTE Need a different note to not collide with the previous run dir
+    args = ("run", DUMMY_MODEL, "--no-eval", "--note", "metric_N", "-d")
+    res = invoke_cli(args + ("-N", "1.23k", "--no-work"))
+    _check_result(res, expected_exit=0)
+    assert "num_steps: 1230" in res.output
+
+    # ... and invalid values are reported before anything is set up
+    for bad_value in ("foo", "1.23x", "-1k"):
+        res = invoke_cli(args + ("-N", bad_value))
+        _check_result(res, expected_exit=2)
+        assert "Invalid value for '-N' / '--num-steps'" in res.output
+        assert "Updates to meta configuration" not in res.output
+
 
 def test_run_existing(with_test_models, tmp_output_dir):
     """Tests the invocation of the utopya run_existing command"""
@@ -201,6 +215,20 @@ def test_run_existing(with_test_models, tmp_output_dir):
     assert "Finished working. Total tasks worked on: 4" in res.output
 
 
+def test_run_existing_bad_args():
+    """Conflicting arguments to utopya run-existing are detected before the
+    model or the run directory are even looked at"""
+    args = ("run-existing", "some_model", "/some/nonexisting/run_dir")
+
+    res = invoke_cli(args + ("--skip-existing", "--clear-existing"))
+    _check_result(res, expected_exit=2)
+    assert "are exclusive" in res.output
+
+    res = invoke_cli(args + ("--uni", "1", "--skip-existing"))
+    _check_result(res, expected_exit=2)
+    assert "cannot be set together" in res.output
+
+
 def test_eval(with_test_models, tmp_output_dir, delay):
     """Tests the invocation of the utopya eval command"""
     # Simplest case
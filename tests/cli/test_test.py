@@ -70,3 +70,70 @@ def test_test(with_test_models):
     assert "test session starts" in res.output
     assert "no tests ran" in res.output
     assert "file or directory not found" in res.output
+
+    # Can control whether pytest uses its cache
+    res = invoke_cli(("test", ADVANCED_MODEL, "-x", "--no-pytest-cache"))
+    print(res.output)
+    assert res.exit_code == 0
+    assert "pytest -x -p no:cacheprovider" in res.output
+    assert "1 passed" in res.output
+
+    res = invoke_cli(("test", ADVANCED_MODEL, "-x", "--pytest-cache"))
+    assert res.exit_code == 0
+    assert "no:cacheprovider" not in res.output
+
+    # The shown command is quoted such that it can be copied to a shell
+    res = invoke_cli(("test", ADVANCED_MODEL, "-k", "not foo and not bar"))
+    print(res.output)
+    assert "pytest -k 'not foo and not bar'" in res.output
+
+
+def test_prepended_to_sys_path():
+    """Tests that only the inserted sys.path entries are removed again"""
+    from utopya_cli.test import _prepended_to_sys_path
+
+    old_sys_path = list(sys.path)
+    some_path = "".join(("/some/", "path"))
+    sys.path.append(some_path)
+
+    with _prepended_to_sys_path("".join(("/some/", "path")), "/foo"):
+        assert sys.path[:2] == ["/foo", some_path]
+
+        # Another entry that is equal to an inserted one; remains
+        sys.path.insert(0, "".join(("/fo", "o")))
+
+    assert sys.path == ["/foo"] + old_sys_path + [some_path]
+    assert sys.path[-1] is some_path
+
+    sys.path[:] = old_sys_path
+
+
+def test_test_errors(monkeypatch):
+    """Tests error messages of `utopya test` before invoking pytest"""
+    import types
+
+    import utopya
+
+    class MockModel:
+        py_tests_dir = "/some/non-existing/tests_dir"
+
+        def __init__(self, **_):
+            paths = dict(py_tests_dir=self.py_tests_dir)
+            self.info_bundle = types.SimpleNamespace(paths=paths)
+
+    monkeypatch.setattr(utopya, "Model", MockModel)
+
+    res = invoke_cli(("test", "some_model"))
+    print(res.output)
+    assert res.exit_code == 1
+    assert "test directory of this model does not exist" in res.output
+    assert "test session starts" not in res.output
+
+    # If pytest is not available, there is an error message as well
+    monkeypatch.setattr(MockModel, "py_tests_dir", os.getcwd())
+    monkeypatch.setitem(sys.modules, "pytest", None)
+
+    res = invoke_cli(("test", "some_model"))
+    print(res.output)
+    assert res.exit_code == 1
+    assert "Could not import pytest" in res.output
@@ -176,6 +176,7 @@ def test_registry_basics(tmpdir):
     # Create another registry that automatically loads existing entries from
     # the registry directory -- stray files and directories are ignored
     os.mkdir(tmpdir.join("some_directory"))
+    os.mkdir(tmpdir.join("a_directory.yml"))
     with open(tmpdir.join("stray_file.txt"), mode="w") as f:
         f.write("foo")
 
@@ -205,6 +206,59 @@ def test_registry_reload(test_registry):
         assert reg[entry_name] is not old_entry
 
 
+def test_registry_file_cache(test_registry, monkeypatch):
+    """Tests that unchanged registry files are not parsed again"""
+    import utopya._yaml_registry._cache as _cache
+
+    reg = test_registry
+    loaded = []
+
+    def counting_load_yml(path):
+        loaded.append(path)
+        return load_yml(path)
+
+    monkeypatch.setattr(_cache, "_load_yml", counting_load_yml)
+
+    # Files were just written, thus not cached and need to be parsed
+    reg.reload()
+    assert len(loaded) == 2
+
+    # Reloading again uses the cache; the entries' data are independent
+    reg.reload()
+    assert len(loaded) == 2
+    assert reg["test00"].nested.a_str == "foo"
+
+    reg["test00"].nested.a_dict["foo"] = "bar"
+    reg.reload()
+    assert reg["test00"].nested.a_dict == {}
+
+    # Writing an entry invalidates its cache
+    reg["test01"].desc = "spam"
+    reg["test01"].write()
+    reg.reload()
+    assert len(loaded) == 3
+    assert reg["test01"].desc == "spam"
+
+    # Externally changing a file (mtime or size) is detected as well
+    entry = reg["test00"]
+    payload = load_yml(entry.registry_file_path)
+    payload["desc"] = "a changed description"
+    with open(entry.registry_file_path, mode="w") as f:
+        f.write(f"desc: {payload['desc']}\n")
+        f.write(f"nested: {dict(payload['nested'])}\n")
+
+    reg.reload()
+    assert len(loaded) == 4
+    assert reg["test00"].desc == "a changed description"
+
+    # Cache size is bounded
+    monkeypatch.setattr(_cache, "CACHE_MAX_SIZE", 1)
+    _cache._CACHE.clear()
+    _cache.load_registry_file(reg["test00"].registry_file_path)
+    _cache.load_registry_file(reg["test01"].registry_file_path)
+    assert len(_cache._CACHE) == 1
+
+
 def test_registry_adding_and_removing_entries(test_registry):
     """Tests the dict-like interface for the registry"""
     reg = test_registry
@@ -6,7 +6,11 @@ import os
 import pytest
 
 import utopya.model_registry as umr
-from utopya.model_registry import BundleExistsError, ModelRegistryError
+from utopya.model_registry import (
+    BundleExistsError,
+    ModelInfoBundle,
+    ModelRegistryError,
+)
 from utopya.yaml import load_yml, write_yml, yaml
 
 from . import DEMO_DIR, TEST_PROJECT_NAME, get_cfg_fpath
@@ -359,6 +363,8 @@ def test_ModelRegistry(tmp_cfg_dir):
     # String representation
     assert "bundle" not in mr.info_str
     assert "bundle" in mr.info_str_detailed
+    assert "\n".join(mr.info_iter_detailed()) == mr.info_str_detailed
+    assert len(list(mr.info_iter_detailed())) == len(mr) + 1
 
     # dict access
     assert "model1" in mr
@@ -376,6 +382,62 @@ def test_ModelRegistry(tmp_cfg_dir):
     with pytest.raises(ValueError, match="already is a model registered"):
         mr._add_entry("model1")
 
+    # Default label
+    mr.set_default_label("model2", "some_label")
+    assert entry2.default_label == "some_label"
+    assert load_yml(entry2.registry_file_path)["default_label"] == "some_label"
+
+    with pytest.raises(ValueError, match="cannot be set as default"):
+        mr.set_default_label("model2", "bad_label")
+    assert entry2.default_label == "some_label"
+
+    mr.set_default_label("model2", None)
+    assert entry2.default_label is None
+
+    # Registering many bundles at once
+    entries = mr.register_many(
+        [
+            ("model2", dict(label="many1", **mib_kwargs(some_val=1))),
+            ("model2", dict(label="many2", **mib_kwargs(some_val=2))),
+            ("model3", dict(label="many1", **mib_kwargs(some_val=3))),
+        ]
+    )
+    assert set(entries) == {"model2", "model3"}
+    assert entries["model2"] is entry2
+    assert "many1" in entry2 and "many2" in entry2
+    assert "many1" in mr["model3"]
+    for name in ("model2", "model3"):
+        stored = load_yml(mr[name].registry_file_path)["info_bundles"]
+        assert "many1" in stored
+
+    # On failure, bundles added up to that point are still stored
+    with pytest.raises(BundleExistsError):
+        mr.register_many(
+            [
+                ("model3", dict(label="many2", **mib_kwargs(some_val=3))),
+                ("model3", dict(label="many1", **mib_kwargs(some_val=4))),
+            ]
+        )
+    stored = load_yml(mr["model3"].registry_file_path)["info_bundles"]
+    assert "many2" in stored
+
+    entry2.pop("many1")
+    entry2.pop("many2")
+    mr.remove_entry("model3")
+
+    # Bundle removal
+    mr.register_model_info(
+        "model2", label="another_label", **mib_kwargs(some_val=123123)
+    )
+    assert len(entry2) == 2
+    assert isinstance(
+        mr.pop_bundle("model2", "another_label"), ModelInfoBundle
+    )
+    assert len(entry2) == 1
+
+    with pytest.raises(KeyError):
+        mr.pop_bundle("model2", "another_label")
+
     # Item removal
     assert os.path.isfile(entry2.registry_file_path)
     mr.remove_entry("model2")
@@ -0,0 +1,56 @@
+"""Implements an in-memory cache for the content of registry files, such that
+(re-)loading a registry only parses those files that actually changed."""
+
+import collections
+import copy
+import os
+
+from .._yaml import load_yml as _load_yml
+
+_CACHE = collections.OrderedDict()
+"""Maps absolute registry file paths to their ``(mtime_ns, size)`` at the time
+of loading and the loaded data; ordered by last access."""
+
+CACHE_MAX_SIZE: int = 128
+"""Maximum number of registry files to keep in memory"""
+
+
+def load_registry_file(path: str) -> dict:
+    """Loads a registry file, using the in-memory cache if the file did not
+    change since it was last loaded.
+
+    A file is considered unchanged if its modification time and size are the
+    same as when it was loaded. The returned data is a deep copy, such that
+    it can be changed without affecting the cache.
+
+    Args:
+        path (str): Path to the registry file
+
+    Returns:
+        dict: The content of the registry file
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        _CACHE.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    data = _load_yml(path)
+    _CACHE[path] = (key, data)
+    _CACHE.move_to_end(path)
+    while len(_CACHE) > CACHE_MAX_SIZE:
+        _CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def invalidate(path: str):
+    """Removes the cached content of a registry file, if there is any.
+
+    This should be called whenever the file is written or removed, as the
+    modification time may not change for writes in quick succession.
+    """
+    _CACHE.pop(os.path.abspath(path), None)
@@ -7,9 +7,10 @@ from typing import Any
 
 import pydantic
 
-from .._yaml import load_yml as _load_yml
 from .._yaml import write_yml as _write_yml
 from ..exceptions import MissingRegistryError, SchemaValidationError
+from ._cache import invalidate as _invalidate_cache
+from ._cache import load_registry_file as _load_registry_file
 
 log = logging.getLogger(__name__)
 
@@ -246,7 +247,7 @@ class RegistryEntry:
             )
 
         try:
-            d = _load_yml(self.registry_file_path)
+            d = _load_registry_file(self.registry_file_path)
 
         except Exception as exc:
             raise type(exc)(
@@ -276,6 +277,7 @@ class RegistryEntry:
 
         data = json.loads(self.data.model_dump_json())
         _write_yml(data, path=self.registry_file_path)
+        _invalidate_cache(self.registry_file_path)
 
     def remove_registry_file(self):
         """Removes the corresponding registry file"""
@@ -285,3 +287,4 @@ class RegistryEntry:
             )
 
         os.remove(self.registry_file_path)
+        _invalidate_cache(self.registry_file_path)
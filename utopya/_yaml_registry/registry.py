@@ -81,7 +81,10 @@ class YAMLRegistry:
 
         log.debug("Re-loading entries from registry directory ...")
         new_entries = []
-        for fname in os.listdir(self.registry_dir):
+        with os.scandir(self.registry_dir) as dir_entries:
+            fnames = [e.name for e in dir_entries if e.is_file()]
+
+        for fname in fnames:
             name, ext = os.path.splitext(fname)
 
             if name in self or ext != self._EntryCls.FILE_EXTENSION:
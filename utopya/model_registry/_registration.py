@@ -1,6 +1,7 @@
 """Tools for model registration"""
 
 import logging
+from typing import Sequence, Union
 
 log = logging.getLogger(__name__)
 
@@ -12,11 +13,11 @@ def register_models_from_list(
     *,
     registry: "utopya.model_registry.registry.ModelRegistry",
     separator: str,
-    model_names: str,
-    executables: str,
+    model_names: Union[str, Sequence[str]],
+    executables: Union[str, Sequence[str]],
     label: str,
     more_paths: dict = dict(),
-    source_dirs: str = None,
+    source_dirs: Union[str, Sequence[str]] = None,
     exists_action: str = "raise",
     set_as_default: bool = None,
     project_name: str = None,
@@ -30,13 +31,15 @@ def register_models_from_list(
         registry (utopya.model_registry.registry.ModelRegistry): The model
             registry to store the models in
         separator (str): Separation string to split ``model_names``,
-            ``executables``, and ``source_dirs``.
-        model_names (str): Splittable string of model names
-        executables (str): Splittable string of executables
+            ``executables``, and ``source_dirs``, if they are strings.
+        model_names (Union[str, Sequence[str]]): Splittable string of model
+            names or an already split sequence of them
+        executables (Union[str, Sequence[str]]): Splittable string of
+            executables or an already split sequence of them
         label (str): Label under which to add the entries
         more_paths (dict, optional): Additional paths that are to be parsed
-        source_dirs (str, optional): Splittable string of model source
-            directories
+        source_dirs (Union[str, Sequence[str]], optional): Splittable string
+            of model source directories or an already split sequence
         exists_action (str, optional): Action to take upon existing label
         project_name (str, optional): The associated project name
         _log (logging.Logger, optional): A logger-like object
@@ -48,12 +51,14 @@ def register_models_from_list(
         separator,
     )
 
-    model_names = model_names.split(separator)
-    executables = executables.split(separator)
+    if isinstance(model_names, str):
+        model_names = model_names.split(separator)
+    if isinstance(executables, str):
+        executables = executables.split(separator)
 
     if not source_dirs:
         source_dirs = [None for _ in model_names]
-    else:
+    elif isinstance(source_dirs, str):
         source_dirs = source_dirs.split(separator)
 
     if not (len(model_names) == len(executables) == len(source_dirs)):
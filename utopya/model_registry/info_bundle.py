@@ -323,18 +323,40 @@ class ModelInfoBundle:
                 os.path.join(base_source_dir, source_dir)
             )
 
+        # Paths that are already known to exist and need not be checked again
+        existing_paths = set()
+
         # If a source directory is given, store it, then auto-detect some files
         if abs_source_dir_path:
             paths["source_dir"] = abs_source_dir_path
 
+            # Scan the directory once instead of checking each candidate path
+            # individually; only if scanning fails, or for paths pointing into
+            # subdirectories, check the individual paths.
+            try:
+                with os.scandir(abs_source_dir_path) as entries:
+                    src_dir_content = {
+                        e.name for e in entries if e.is_file() or e.is_dir()
+                    }
+                existing_paths.add(abs_source_dir_path)
+
+            except OSError:
+                src_dir_content = None
+
             for key, fname_fstr in self.SRC_DIR_SEARCH_PATHS.items():
                 # Build the full file path, making the model name available.
                 # If that path points to an existing file or directory, add it.
                 fname = fname_fstr.format(model_name=self.model_name)
                 fpath = os.path.join(abs_source_dir_path, fname)
 
-                if os.path.exists(fpath):
+                if src_dir_content is not None and os.sep not in fname:
+                    exists = fname in src_dir_content
+                else:
+                    exists = os.path.exists(fpath)
+
+                if exists:
                     paths[key] = fpath
+                    existing_paths.add(fpath)
 
         # Parse remaining path entries
         for key, path in more_paths.items():
@@ -352,6 +374,8 @@ class ModelInfoBundle:
 
                 # Path exists and was not yet added; store it under the subkey
                 key = subkey
+                if os.path.isabs(path):
+                    existing_paths.add(path)
 
             # Interpret relative paths as relative to the source directory
             if not os.path.isabs(path):
@@ -387,7 +411,7 @@ class ModelInfoBundle:
                     "Please provide only absolute paths (may include ~)."
                 )
 
-            if not os.path.exists(path):
+            if path not in existing_paths and not os.path.exists(path):
                 msg = (
                     f"Given '{key}' path for model '{self.model_name}' does "
                     f"not exist: {path}"
@@ -7,7 +7,7 @@ import copy
 import logging
 import os
 from itertools import chain
-from typing import Dict
+from typing import Dict, Iterable, Iterator, Tuple
 
 import dantro.utils
 from dantro.logging import CAUTION as _CAUTION
@@ -17,6 +17,7 @@ from ..cfg import UTOPYA_CFG_DIR
 from ..exceptions import BundleExistsError, MissingModelError
 from ..tools import make_columns, pformat, recursive_update
 from .entry import ModelRegistryEntry
+from .info_bundle import ModelInfoBundle
 
 log = logging.getLogger(__name__)
 log.setLevel(_CAUTION)
@@ -119,6 +120,16 @@ class ModelRegistry:
     def info_str_detailed(self) -> str:
         """Returns a multi-line info string showing all registered models
         with additional details."""
+        return "\n".join(self.info_iter_detailed())
+
+    def info_iter_detailed(self) -> Iterator[str]:
+        """Yields the blocks of :py:attr:`.info_str_detailed` one by one: first
+        the header, then one multi-line block per registered model.
+
+        This allows to output the detailed information without first
+        rendering all entries; joining the blocks with newlines gives the
+        same result as :py:attr:`.info_str_detailed`.
+        """
         lines = []
         lines.append(
             "utopya model registry ({} model{} registered)"
@@ -126,9 +137,10 @@ class ModelRegistry:
         )
         lines.append("-" * len(lines[-1]))
         lines.append("Default bundles are marked (*)\n")
+        yield "\n".join(lines)
 
         for model_name, entry in self.items():
-            lines.append(f"{model_name}")
+            lines = [f"{model_name}"]
 
             # Bundle information
             lines.append(
@@ -146,8 +158,7 @@ class ModelRegistry:
 
             # Done for this model
             lines.append("")
-
-        return "\n".join(lines)
+            yield "\n".join(lines)
 
     # TODO Improve output formats and amount of information
     # TODO Consider supporting machine-parseable form?
@@ -219,6 +230,90 @@ class ModelRegistry:
         # entry, not the newly added bundle
         return self[model_name]
 
+    def register_many(
+        self, entries: Iterable[Tuple[str, dict]]
+    ) -> Dict[str, ModelRegistryEntry]:
+        """Registers information for many models at once, writing each
+        affected registry file only once rather than once per bundle.
+
+        If adding one of the bundles fails, the registry files of all entries
+        that were changed up to that point are still written, such that the
+        registry files are in the same state as if the bundles had been
+        registered one by one via :py:meth:`.register_model_info`.
+
+        Args:
+            entries (Iterable[Tuple[str, dict]]): Pairs of model name and
+                bundle kwargs, the latter being passed on to
+                ``ModelRegistryEntry.add_bundle``.
+
+        Returns:
+            Dict[str, ModelRegistryEntry]: The updated registry entries,
+                keyed by model name.
+        """
+        updated = dict()
+        num_bundles = 0
+
+        try:
+            for model_name, bundle_kwargs in entries:
+                if model_name not in self:
+                    self._add_entry(model_name)
+
+                entry = self[model_name]
+                entry.add_bundle(**bundle_kwargs, update_registry_file=False)
+                updated[model_name] = entry
+                num_bundles += 1
+
+        finally:
+            for entry in updated.values():
+                entry._update_registry_file()
+
+        log.info(
+            "Registered %d bundle%s for %d model%s.",
+            num_bundles,
+            "s" if num_bundles != 1 else "",
+            len(updated),
+            "s" if len(updated) != 1 else "",
+        )
+        return updated
+
+    def pop_bundle(self, model_name: str, label: str) -> ModelInfoBundle:
+        """Removes a single info bundle from the registry entry of the given
+        model and updates the associated registry file.
+
+        Args:
+            model_name (str): The name of the model whose bundle is to be
+                removed
+            label (str): The label of the info bundle to remove
+
+        Returns:
+            ModelInfoBundle: The removed info bundle
+
+        Raises:
+            KeyError: On a label not available for the given model
+        """
+        bundle = self[model_name].pop(label)
+        log.info(
+            "Removed info bundle '%s' from registry entry of model '%s'.",
+            label,
+            model_name,
+        )
+        return bundle
+
+    def set_default_label(self, model_name: str, label: str):
+        """Sets the default info bundle label of the given model and updates
+        the associated registry file.
+
+        Args:
+            model_name (str): The name of the model
+            label (str): The label of the info bundle to use as default. May
+                be None to unset the default label.
+
+        Raises:
+            ValueError: On a label not available for the given model
+        """
+        self[model_name].set_default_label(label)
+        log.info("Set default label of model '%s' to '%s'.", model_name, label)
+
     def remove_entry(self, model_name: str):
         """Removes a registry entry and deletes the associated registry file.
 
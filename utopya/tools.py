@@ -211,6 +211,13 @@ def ensure_dict(d: Optional[dict]) -> dict:
     return ensure_not_None(d, fallback=dict)
 
 
+_SI_SUFFIXES = dict(k=1e3, M=1e6, G=1e9, T=1e12)
+_SI_MULTIPLIER_PATTERN = re.compile(
+    r"^(?P<value>\-?\s?\d+|\-?\s?\d+\.\d+)?\s?(?P<suffix>[kMGT])?$"
+)
+# See:  https://regex101.com/r/xngAoc/1
+
+
 def parse_si_multiplier(s: str) -> int:
     """Parses a string like ``1.23M`` or ``-2.34 k`` into an integer.
 
@@ -237,11 +244,7 @@ def parse_si_multiplier(s: str) -> int:
     Raises:
         ValueError: Upon string that does not match the expected pattern
     """
-    SUFFIXES = dict(k=1e3, M=1e6, G=1e9, T=1e12)
-    pattern = r"^(?P<value>\-?\s?\d+|\-?\s?\d+\.\d+)?\s?(?P<suffix>[kMGT])?$"
-    # See:  https://regex101.com/r/xngAoc/1
-
-    match = re.match(pattern, s.strip())
+    match = _SI_MULTIPLIER_PATTERN.match(s.strip())
     if not match:
         raise ValueError(
             f"Cannot parse '{s}' into an integer! May only contain the metric "
@@ -250,7 +253,7 @@ def parse_si_multiplier(s: str) -> int:
 
     groups = match.groupdict()
     val = float(groups["value"].replace(" ", ""))
-    mul = SUFFIXES[groups["suffix"]] if groups["suffix"] else 1
+    mul = _SI_SUFFIXES[groups["suffix"]] if groups["suffix"] else 1
 
     return int(val * mul)
 
@@ -1,5 +1,3 @@
 """The utopya CLI"""
 
-import dantro.logging
-
 from .cli import cli
@@ -6,6 +6,7 @@ import os
 from typing import Callable, Dict, List, Sequence, Tuple
 
 import click
+import dantro.logging  # sets up the logger class with additional levels
 
 log = logging.getLogger(__name__)
 
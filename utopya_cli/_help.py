@@ -0,0 +1,42 @@
+"""Longer help texts for CLI options.
+
+These are looked up by :py:class:`~utopya_cli._utils.HelpKeyOption` only
+when a help message is actually generated, such that this module need not be
+imported for regular CLI invocations.
+"""
+
+HELP = dict()
+
+# -- utopya models register from-list
+HELP["register_from_list"] = dict(
+    executables=(
+        "A list of paths pointing to the model executables. "
+        "Paths may be given as relative to the ``--base-executable-dir``. "
+        "If all paths match a pattern, consider using the "
+        "``--executable-fstr`` argument instead. "
+        "One of these arguments *needs* to be given."
+    ),
+    source_dirs=(
+        "A list of paths pointing to the model source directories. "
+        "Paths may be given as relative to the ``--base-source-dir``. "
+        "If all paths match a pattern, consider using the "
+        "``--source-dir-fstr`` argument instead."
+    ),
+    executable_fstr=(
+        "A format string that can be used instead of the ``--executables`` "
+        "argument and is evaluated for each entry in ``MODEL_NAMES``."
+    ),
+    source_dir_fstr=(
+        "A format string that can be used instead of the ``--source-dirs`` "
+        "argument and is evaluated for each entry in ``MODEL_NAMES``."
+    ),
+    separator=(
+        "By which separator to split the ``--model-names``, "
+        "``--executables``, and ``--source-dirs`` arguments. Default: ``;``"
+    ),
+    label=(
+        "Label to identify the info bundles with; if not given, will use a "
+        "default value. This allows registering multiple versions of a model "
+        "under the same name."
+    ),
+)
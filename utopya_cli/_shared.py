@@ -40,6 +40,13 @@ UTOPYA_CFG_SUBDIRS = {
 }
 """Absolute configuration file paths"""
 
+UTOPYA_CACHE_DIR: str = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "utopya",
+)
+"""Directory where the CLI may store cached data, e.g. parsed manifest files.
+Its content can safely be deleted."""
+
 DEFAULT_RUN_DIR_SEARCH_PATHS: str = [
     "~/utopya_output",
     "~/utopia_output",
@@ -99,7 +106,12 @@ def complete_project_names(*args) -> List[str]:
 
 
 def complete_run_dirs(
-    ctx, param, incomplete: str, *, extra_search_dirs: list = []
+    ctx,
+    param,
+    incomplete: str,
+    *,
+    extra_search_dirs: list = [],
+    max_num: int = 50,
 ) -> List[str]:
     """Completes run directories for the selected model name.
 
@@ -120,45 +132,58 @@ def complete_run_dirs(
             - ~/utopia_output
             # ... can add more here ...
 
+    Only directory names starting with ``incomplete`` are returned, the most
+    recent ones first and at most ``max_num`` of them.
+
     .. todo::
 
         Auto-complete local paths as well, starting from CWD.
     """
-    from dantro.tools import load_yml
+    from ._utils import load_yml_cached
 
     # Need the model name
     model_name = ctx.params["model_name"]
 
-    # Get search directories from config and assemble model output directories
+    # Get search directories from config and assemble model output directories.
+    # As completion is invoked upon each key press, the config file content is
+    # taken from the cache, which avoids any YAML parsing if it is unchanged.
     cli_cfg = {}
     if os.path.exists(UTOPYA_CFG_FILE_PATHS["utopya"]):
-        cli_cfg = load_yml(UTOPYA_CFG_FILE_PATHS["utopya"]).get("cli", {})
-
-    search_dirs = cli_cfg.get(
-        "run_dir_search_paths", DEFAULT_RUN_DIR_SEARCH_PATHS
+        cli_cfg = load_yml_cached(
+            UTOPYA_CFG_FILE_PATHS["utopya"],
+            cache_dir=os.path.join(UTOPYA_CACHE_DIR, "cfg"),
+        )
+        cli_cfg = (cli_cfg if cli_cfg else {}).get("cli", {})
+
+    search_dirs = list(
+        cli_cfg.get("run_dir_search_paths", DEFAULT_RUN_DIR_SEARCH_PATHS)
     )
     search_dirs += extra_search_dirs
     model_out_dirs = [
         os.path.join(os.path.expanduser(d), model_name) for d in search_dirs
     ]
 
-    # Aggregate candidate directory names, then sort and filter them
+    # Aggregate matching directory names, checking the cheap name-based
+    # conditions before the directory check. Then sort them such that the
+    # most recent ones (by timestamp prefix) come first.
     candidates = []
     for model_out_dir in model_out_dirs:
-        if not os.path.isdir(model_out_dir):
+        try:
+            with os.scandir(model_out_dir) as entries:
+                candidates += [
+                    e.name
+                    for e in entries
+                    if e.name.startswith(incomplete)
+                    and not e.name.startswith(".")
+                    and e.is_dir()
+                ]
+
+        except OSError:
             continue
 
-        candidates += [
-            os.path.basename(p)
-            for p in glob.glob(os.path.join(model_out_dir, "*"))
-            if os.path.isdir(p)
-        ]
-
     # TODO Fall back to auto-completion of local paths, if possible
 
-    return [
-        p for p in reversed(sorted(candidates)) if p.startswith(incomplete)
-    ]
+    return sorted(candidates, reverse=True)[:max_num]
 
 
 # -----------------------------------------------------------------------------
@@ -184,6 +209,39 @@ def default_none(ctx, _, value) -> Union[None, tuple]:
     return value
 
 
+class NumSteps(click.ParamType):
+    """A non-negative integer that may be given with a metric suffix, like
+    ``1.23M``, or in scientific notation; see
+    :py:func:`utopya.tools.parse_num_steps`.
+
+    Plain integers are converted directly, such that utopya need not be
+    imported for them.
+    """
+
+    name = "num_steps"
+
+    def convert(self, value, param, ctx) -> int:
+        if isinstance(value, int):
+            N = value
+
+        else:
+            try:
+                N = int(value)
+
+            except ValueError:
+                from utopya.tools import parse_num_steps
+
+                try:
+                    return parse_num_steps(value)
+
+                except ValueError as err:
+                    self.fail(str(err), param, ctx)
+
+        if N < 0:
+            self.fail(f"Needs to be non-negative, but was {N}!", param, ctx)
+        return N
+
+
 # .............................................................................
 
 OPTIONS = dict()
@@ -237,12 +295,15 @@ OPTIONS["cluster_mode"] = (
         help="Enables cluster mode.",
     ),
 )
+_CPU_COUNT: int = os.cpu_count() or 1
+"""The number of CPUs, determining the valid range of ``--num-workers``"""
+
 OPTIONS["num_workers"] = (
     click.option(
         "-W",
         "--num-workers",
         default=None,
-        type=click.IntRange(min=-os.cpu_count() + 1, max=+os.cpu_count()),
+        type=click.IntRange(min=-_CPU_COUNT + 1, max=+_CPU_COUNT),
         help=(
             "Shortcut for meta-config entry ``worker_manager.num_workers``, "
             "which sets the number of worker processes. "
@@ -343,3 +404,40 @@ OPTIONS["eval"] = (
         help="If set, opens the output directory after plotting finished.",
     ),
 )
+
+# -- Listing
+OPTIONS["long_mode"] = (
+    click.option(
+        "-l",
+        "--long",
+        "long_mode",
+        is_flag=True,
+        help="Show more detailed information.",
+    ),
+)
+
+# -- Model registration
+MODEL_EXISTS_ACTIONS = click.Choice(("skip", "raise", "validate", "overwrite"))
+"""Valid choices for ``--exists-action`` when registering models"""
+
+OPTIONS["register"] = (
+    click.option(
+        "--set-default",
+        "set_as_default",
+        is_flag=True,
+        default=None,
+        help=("Whether to set the registered model(s) as default."),
+    ),
+    click.option(
+        "--exists-action",
+        default="validate",
+        type=MODEL_EXISTS_ACTIONS,
+        help=(
+            "Which action to take upon an existing bundle with the same "
+            "label. By default, validates the to-be-added information with a "
+            "potentially existing bundle; this will fail if the to-be-added "
+            "bundle does not compare equal to an existing bundle with the "
+            "same label."
+        ),
+    ),
+)
@@ -1,17 +1,32 @@
 """Various utilities used within the CLI definition and for handling click"""
 
+import collections
+import contextlib
 import copy
 import logging
 import os
 import sys
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import click
-import paramspace as psp
 
-log = logging.getLogger(__name__)
-# FIXME This logger does not support all levels that are used throughout this
-#       module, because it is setup prior to the utopya import.
+# -----------------------------------------------------------------------------
+# Deferred imports
+
+
+def _get_logger() -> logging.Logger:
+    """Returns the logger of this module.
+
+    The logger is only created upon first call, after importing
+    :py:mod:`dantro.logging`, which sets up the logger class that provides the
+    additional log levels (``remark``, ``note``, ...) used in the CLI.
+    Importing dantro is comparatively expensive, thus this should not happen
+    at CLI startup.
+    """
+    import dantro.logging
+
+    return logging.getLogger(__name__)
+
 
 # -----------------------------------------------------------------------------
 # Communication via Terminal
@@ -38,6 +53,11 @@ class ANSIesc:
     ORANGE = "\033[38;5;202m"
 
 
+_ECHO_KWARGS = {"file", "nl", "err", "color"}
+"""Arguments to :py:func:`click.secho` that are passed on to the echo call
+rather than affecting the style; messages using these are never buffered"""
+
+
 def _parse_msg(msg: str, args) -> str:
     if args:
         return msg % args
@@ -50,9 +70,59 @@ class Echo:
     The styles are aligned with those set in the utopya.logging module.
     """
 
+    _buffer: List[str] = None
+    _flush_every: int = None
+
+    @staticmethod
+    def _secho(msg: str, **style):
+        """Echoes a styled message or, if buffering, adds it to the buffer"""
+        if Echo._buffer is None or _ECHO_KWARGS.intersection(style):
+            Echo.flush()
+            click.secho(msg, **style)
+            return
+
+        Echo._buffer.append(click.style(msg, **style))
+        if len(Echo._buffer) >= Echo._flush_every:
+            Echo.flush()
+
+    @staticmethod
+    def flush():
+        """Writes out all buffered messages at once"""
+        if Echo._buffer:
+            click.echo("\n".join(Echo._buffer))
+            Echo._buffer.clear()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def buffered(*, flush_every: int = 10):
+        """A context manager within which messages are not echoed one by one
+        but collected and written out in batches, reducing the number of
+        write operations for commands that produce a lot of output.
+
+        Args:
+            flush_every (int, optional): After how many messages to write out
+                the buffer. Upon exiting the context, all remaining messages
+                are written out.
+        """
+        if Echo._buffer is not None:
+            # Already buffering
+            yield
+            return
+
+        Echo._buffer = []
+        Echo._flush_every = flush_every
+        try:
+            yield
+
+        finally:
+            Echo.flush()
+            Echo._buffer = None
+            Echo._flush_every = None
+
     @staticmethod
     def help(*, exit: int = None):
         """Shows the help message of the current context"""
+        Echo.flush()
         click.echo(click.get_current_context().get_help())
         if exit is not None:
             sys.exit(exit)
@@ -60,52 +130,52 @@ class Echo:
     @staticmethod
     def trace(msg: str, *args, dim=True, **style):
         """An echo that communicates some debug-level information"""
-        click.secho(_parse_msg(msg, args), dim=dim, **style)
+        Echo._secho(_parse_msg(msg, args), dim=dim, **style)
 
     @staticmethod
     def debug(msg: str, *args, dim=True, **style):
         """An echo that communicates some debug-level information"""
-        click.secho(_parse_msg(msg, args), dim=dim, **style)
+        Echo._secho(_parse_msg(msg, args), dim=dim, **style)
 
     @staticmethod
     def remark(msg: str, *args, fg=246, **style):
         """An echo that communicates some low-level information"""
-        click.secho(_parse_msg(msg, args), fg=fg, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, **style)
 
     @staticmethod
     def note(msg: str, *args, fg="cyan", **style):
         """An echo that communicates some low-level information"""
-        click.secho(_parse_msg(msg, args), fg=fg, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, **style)
 
     @staticmethod
     def info(msg: str, *args, **style):
         """An echo that communicates some information"""
-        click.secho(_parse_msg(msg, args), **style)
+        Echo._secho(_parse_msg(msg, args), **style)
 
     @staticmethod
     def progress(msg: str, *args, fg="green", **style):
         """An echo that communicates some progress"""
-        click.secho(_parse_msg(msg, args), fg=fg, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, **style)
 
     @staticmethod
     def caution(msg: str, *args, fg=202, **style):
         """An echo that communicates a cautioning message"""
-        click.secho(_parse_msg(msg, args), fg=fg, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, **style)
 
     @staticmethod
     def hilight(msg: str, *args, fg="yellow", bold=True, **style):
         """An echo that highlights a certain"""
-        click.secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
 
     @staticmethod
     def success(msg: str, *args, fg="green", bold=True, **style):
         """An echo that communicates a success"""
-        click.secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
 
     @staticmethod
     def warning(msg: str, *args, fg=202, bold=True, **style):
         """An echo that communicates a warning"""
-        click.secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
 
     @staticmethod
     def error(
@@ -119,15 +189,246 @@ class Echo:
         """An echo that can be used to communicate an error, optionally
         parsing the exception's error msg as well.
         """
-        click.secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
+        Echo._secho(_parse_msg(msg, args), fg=fg, bold=bold, **style)
         if not error:
             return
 
-        click.secho(
+        Echo._secho(
             f"{type(error).__name__}: {error}", fg=fg, bold=False, **style
         )
 
 
+# -----------------------------------------------------------------------------
+# Click extensions
+
+
+class LazyGroup(click.Group):
+    """A :py:class:`click.Group` that imports (some of) its subcommands only
+    when they are actually requested.
+
+    This allows to keep the CLI startup time low: subcommands that are not
+    invoked need not be imported. Lazily-loaded subcommands are specified via
+    a ``name -> "module.path:attribute"`` mapping.
+    """
+
+    def __init__(
+        self, *args, lazy_subcommands: Dict[str, str] = None, **kwargs
+    ):
+        """Sets up a lazily-loading command group
+
+        Args:
+            *args: Passed to :py:class:`click.Group`
+            lazy_subcommands (Dict[str, str], optional): A mapping of command
+                names to import strings of the form ``module.path:attribute``.
+                The module path needs to be absolute.
+            **kwargs: Passed to :py:class:`click.Group`
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands if lazy_subcommands else {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(
+            set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_lazily(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazily(self, cmd_name: str) -> click.Command:
+        """Imports the lazily-specified subcommand of the given name"""
+        import importlib
+
+        modpath, attr = self.lazy_subcommands[cmd_name].split(":")
+        cmd = getattr(importlib.import_module(modpath), attr)
+
+        if not isinstance(cmd, click.Command):
+            raise TypeError(
+                f"Lazily loaded subcommand '{cmd_name}' of group "
+                f"'{self.name}' needs to be a click.Command, but "
+                f"{self.lazy_subcommands[cmd_name]} is of type {type(cmd)}!"
+            )
+        return cmd
+
+
+class HelpKeyOption(click.Option):
+    """A :py:class:`click.Option` that can look up its help text from the
+    :py:data:`utopya_cli._help.HELP` dict instead of receiving it directly.
+
+    The lookup only happens upon accessing the ``help`` attribute, i.e. when
+    a help message is actually generated. Thus, the (potentially long) help
+    texts need not be allocated for CLI invocations that do not show them.
+    """
+
+    def __init__(self, *args, help_key: Tuple[str, str] = None, **kwargs):
+        self._help_key = help_key
+        super().__init__(*args, **kwargs)
+
+    @property
+    def help(self) -> str:
+        """The help text, potentially looked up via the help key"""
+        if self._help is None and self._help_key is not None:
+            from ._help import HELP
+
+            cmd_name, opt_name = self._help_key
+            self._help = HELP[cmd_name][opt_name]
+        return self._help
+
+    @help.setter
+    def help(self, help: str):
+        self._help = help
+
+
+# -----------------------------------------------------------------------------
+# File loading
+
+
+_LOADED_YML = collections.OrderedDict()
+"""In-memory cache of :py:func:`.load_yml_cached`, mapping cache keys to the
+loaded data; bounded by :py:data:`._LOADED_YML_MAX_SIZE`"""
+
+_LOADED_YML_MAX_SIZE: int = 100
+"""The maximum number of entries in the in-memory YAML cache"""
+
+
+def _remember_yml(key: tuple, data):
+    """Stores loaded YAML data in the in-memory cache, evicting the least
+    recently used entries if the cache is full."""
+    _LOADED_YML[key] = data
+    _LOADED_YML.move_to_end(key)
+    while len(_LOADED_YML) > _LOADED_YML_MAX_SIZE:
+        _LOADED_YML.popitem(last=False)
+
+
+def _is_private_dir(path: str) -> bool:
+    """Whether the given directory exists, is owned by the current user and
+    is not writable by group or others.
+
+    On platforms without POSIX ownership information, only checks that the
+    directory exists.
+    """
+    try:
+        stat = os.stat(path)
+
+    except OSError:
+        return False
+
+    if not hasattr(os, "getuid"):
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def load_yml_cached(path: str, *, cache_dir: str = None) -> dict:
+    """Loads a YAML file, caching the parsed content on disk and in memory.
+
+    The cache is keyed by the absolute path of the file, its modification time
+    and its size; if any of these change, the file is parsed anew. Parsed data
+    is stored as a pickle, which is much faster to load than YAML.
+    Within one process, the most recently loaded files are additionally kept
+    in memory, such that repeated loading need not even read the pickle.
+
+    .. note::
+
+        This is meant for plain YAML files like model manifest files, where
+        the parsed content can be pickled.
+
+    .. note::
+
+        As unpickling may execute arbitrary code, the cache directory is
+        created with mode ``0o700`` and is only used if it is owned by the
+        current user and not writable by anyone else.
+
+    Args:
+        path (str): The path of the YAML file to load
+        cache_dir (str, optional): The directory to store cache files in. If
+            not given, uses the ``manifests`` subdirectory of
+            :py:data:`~utopya_cli._shared.UTOPYA_CACHE_DIR`.
+
+    Returns:
+        dict: The loaded YAML data. This is a fresh object that can safely be
+            mutated without affecting the cache.
+    """
+    import hashlib
+    import pickle
+
+    from ._shared import UTOPYA_CACHE_DIR
+
+    path = os.path.abspath(os.path.expanduser(path))
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    if key in _LOADED_YML:
+        _LOADED_YML.move_to_end(key)
+        return copy.deepcopy(_LOADED_YML[key])
+
+    if cache_dir is None:
+        cache_dir = os.path.join(UTOPYA_CACHE_DIR, "manifests")
+    cache_file = os.path.join(
+        cache_dir, hashlib.sha1(path.encode("utf8")).hexdigest() + ".pickle"
+    )
+
+    # Unpickling may execute arbitrary code, so only use a cache directory that
+    # nobody else can write to
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    except OSError:
+        pass
+
+    use_cache = _is_private_dir(cache_dir)
+    if not use_cache:
+        _get_logger().debug(
+            "Not using cache directory %s, as it is not private.", cache_dir
+        )
+
+    # Try to load from cache
+    if use_cache:
+        try:
+            with open(cache_file, "rb") as f:
+                cached_key, data = pickle.load(f)
+
+        except Exception:
+            pass
+
+        else:
+            if cached_key == key:
+                _remember_yml(key, copy.deepcopy(data))
+                return data
+
+    # Need to parse the file. Do so from the already opened file and take the
+    # cache key from that same file handle, such that the key is guaranteed
+    # to match the parsed content even if the file changed in the meantime.
+    # Upon errors, let load_yml take care of encoding fallbacks and hints.
+    from utopya.yaml import load_yml, yaml
+
+    try:
+        with open(path, encoding="utf8") as f:
+            stat = os.fstat(f.fileno())
+            key = (path, stat.st_mtime_ns, stat.st_size)
+            data = yaml.load(f)
+
+    except Exception:
+        data = load_yml(path)
+
+    # Try to update the cache; writing happens via a temporary file to make
+    # the cache update atomic.
+    if use_cache:
+        try:
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump((key, data), f)
+            os.replace(tmp_file, cache_file)
+
+        except Exception as exc:
+            _get_logger().debug(
+                "Failed writing cache file %s: %s", cache_file, exc
+            )
+
+    _remember_yml(key, copy.deepcopy(data))
+    return data
+
+
 # -----------------------------------------------------------------------------
 # Parsing of key-value pairs
 
@@ -209,7 +510,7 @@ def convert_value(
 def set_entries_from_kv_pairs(
     *pairs,
     add_to: dict,
-    _log=log,
+    _log: logging.Logger = None,
     attempt_conversion: bool = True,
     **conversion_kwargs,
 ) -> None:
@@ -230,6 +531,7 @@ def set_entries_from_kv_pairs(
             :py:func:`~utopya_cli._utils.convert_value`
 
     """
+    _log = _log if _log is not None else _get_logger()
 
     _log.remark(
         "Parsing %d key-value pair%s ...",
@@ -290,7 +592,7 @@ def parse_run_and_plots_cfg(
     plots_cfg: str,
     cfg_set: str,
     _interactive_mode: bool = False,
-    _log=log,
+    _log: logging.Logger = None,
 ) -> Tuple[str, str]:
     """Extracts paths to the run configuration and plots configuration by
     looking at the given arguments and the model's configuration sets.
@@ -300,6 +602,8 @@ def parse_run_and_plots_cfg(
     corresponding log message appear. Also, in interactive mode, this will not
     lead to system exit if parsing failed.
     """
+    _log = _log if _log is not None else _get_logger()
+
     if cfg_set and (run_cfg is None or plots_cfg is None):
         _log.info("Looking up config set '%s' ...", cfg_set)
         try:
@@ -330,7 +634,7 @@ def parse_run_and_plots_cfg(
 
 
 def parse_update_dicts(
-    *, _mode: str, _log=log, **all_arguments
+    *, _mode: str, _log: logging.Logger = None, **all_arguments
 ) -> Tuple[dict, dict]:
     """Parses the given arguments, extracting update dictionaries for the
     Multiverse and the plots configuration
@@ -343,8 +647,12 @@ def parse_update_dicts(
     """
     from types import SimpleNamespace
 
+    from paramspace import ParamDim
+
     from utopya.tools import add_item
 
+    _log = _log if _log is not None else _get_logger()
+
     # Make attribute access possible for arguments by using SimpleNamespace
     args = SimpleNamespace(**all_arguments)
 
@@ -426,7 +734,7 @@ def parse_update_dicts(
         if args.num_seeds is not None:
             add_item(
                 args.num_seeds,
-                value_func=lambda v: psp.ParamDim(default=42, range=[v]),
+                value_func=lambda v: ParamDim(default=42, range=[v]),
                 add_to=update_dict,
                 key_path=("parameter_space", "seed"),
                 is_valid=lambda v: bool(v >= 1),
@@ -1,28 +1,23 @@
 """Defines the utopya CLI"""
 
-import click
+from ._utils import LazyGroup
 
-from .batch import batch
-from .config import config
-from .eval import evaluate
-from .models import models
-from .projects import projects
-from .run import run
-from .run_existing import run_existing as __run_existing
-from .test import run_test as test
+SUBCOMMANDS = {
+    "run": "utopya_cli.run:run",
+    "run-existing": "utopya_cli.run_existing:run_existing",
+    "eval": "utopya_cli.eval:evaluate",
+    "test": "utopya_cli.test:run_test",
+    "batch": "utopya_cli.batch:batch",
+    "config": "utopya_cli.config:config",
+    "models": "utopya_cli.models:models",
+    "projects": "utopya_cli.projects:projects",
+}
+"""The subcommands of the CLI and where to import them from; these are only
+imported once they are invoked, see :py:class:`~utopya_cli._utils.LazyGroup`.
+"""
 
-SUBCOMMANDS = [
-    run,
-    __run_existing,
-    evaluate,
-    test,
-    batch,
-    config,
-    models,
-    projects,
-]
-
-cli = click.Group(
+cli = LazyGroup(
+    lazy_subcommands=SUBCOMMANDS,
     help=(
         "**utopya**: a versatile simulation runner and manager\n\n"
         "utopya's main feature is to configure, run, and evaluate computer "
@@ -43,6 +38,3 @@ cli = click.Group(
         "   utopia-project.org  |  gitlab.com/utopia-project/utopya"
     ),
 )
-
-for subcommand in SUBCOMMANDS:
-    cli.add_command(subcommand)
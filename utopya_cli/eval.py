@@ -8,6 +8,7 @@ import traceback
 from typing import List, Tuple, Union
 
 import click
+import dantro.logging  # sets up the logger class with additional levels
 
 from ._shared import (
     INTERACTIVE_MODE_PROHIBITED_ARGS,
@@ -91,7 +92,7 @@ def evaluate(ctx, **params):
     _log.info("Parsing additional command line arguments ...")
     update_dict, update_plots_cfg = parse_update_dicts(_mode="eval", **params)
 
-    if update_dict:
+    if update_dict and _log.isEnabledFor(dantro.logging.NOTE):
         _log.note("Updates to meta configuration:\n\n%s", pformat(update_dict))
 
     model = utopya.Model(
@@ -311,7 +312,7 @@ def _load_and_eval(
             )
             continue
 
-        if update_plots_cfg:
+        if update_plots_cfg and _log.isEnabledFor(dantro.logging.NOTE):
             _log.note(
                 "Updates to plot configuration:\n\n%s",
                 pformat(update_plots_cfg),
@@ -0,0 +1,22 @@
+"""Implements the `utopya models` subcommand tree of the CLI.
+
+The individual subcommands are implemented in their own modules and are only
+imported when they are actually invoked, see
+:py:class:`~utopya_cli._utils.LazyGroup`.
+"""
+
+from .._utils import LazyGroup
+
+models = LazyGroup(
+    name="models",
+    help="Show available models and register new ones.",
+    lazy_subcommands={
+        "ls": "utopya_cli.models._ls:list_models",
+        "rm": "utopya_cli.models._rm:remove_model_or_bundle",
+        "edit": "utopya_cli.models._edit:edit",
+        "set-default": "utopya_cli.models._set_default:set_default",
+        "info": "utopya_cli.models._info:info",
+        "copy": "utopya_cli.models._copy:copy",
+        "register": "utopya_cli.models._register:register",
+    },
+)
@@ -0,0 +1,109 @@
+"""Implements the `utopya models copy` subcommand"""
+
+from typing import Sequence
+
+import click
+
+from .._shared import (
+    OPTIONS,
+    add_options,
+    complete_model_names,
+    complete_project_names,
+)
+from .._utils import Echo
+
+
+@click.command(
+    help=(
+        "Copies a model implementation, creating a model with a new name and "
+        "refactored file content.\n\n"
+        "For instance, all instances of ``MyModel`` will be replaced by "
+        "``CopiedModel`` in file paths and within the files themselves. "
+        "There will *NOT* be any writing without a previous confirmation "
+        "prompt. Alternatively, the ``--dry-run`` flag can be useful to get a "
+        "preview of the effects this command would have.\n\n"
+        "Note that the model implementation will only be copied, registration "
+        "still has to occur separately."
+    )
+)
+@click.argument("model_name", shell_complete=complete_model_names)
+@add_options(OPTIONS["label"])
+@click.option(
+    "--new-name",
+    prompt=True,
+    help="Name of the new model. If not given, will prompt for it.",
+)
+@click.option(
+    "--target-project",
+    prompt=True,
+    shell_complete=complete_project_names,
+    help=(
+        "Name of the utopya project to copy the new model to. If not given, "
+        "will prompt for it. "
+        "Note that this project needs to be known by utopya; "
+        "use `utopya projects register` to register it first."
+    ),
+)
+@click.option(
+    "--pp/--no-pp",
+    "--postprocess/--no-postprocess",
+    "postprocess",
+    default=True,
+    show_default=True,
+    help=("Whether to run post-processing routines for the copied model."),
+)
+# TODO Expand configurability of postprocessing arguments
+@click.option(
+    "--dry-run",
+    flag_value=True,
+    help=(
+        "Perform a dry run: No copy or write operations will be carried out."
+    ),
+)
+# TODO Consider making glob arguments accessible
+@click.option(
+    "--skip-exts",
+    show_default=True,
+    default=".pyc",
+    callback=lambda c, _, val: val.split() if val else (),
+    help=(
+        "File extensions to skip. "
+        "To pass multiple values, use quotes and separate individual "
+        "extensions using spaces. Leading dots are optional."
+    ),
+)
+@click.option(
+    "-y",
+    "--yes",
+    "prompts_confirmed",
+    is_flag=True,
+    help="If set, answers all prompts with yes.",
+)
+@add_options(OPTIONS["debug_flag"])
+def copy(
+    *,
+    model_name: str,
+    label: str,
+    new_name: str,
+    target_project: str,
+    postprocess: bool,
+    dry_run: bool,
+    skip_exts: Sequence[str],
+    prompts_confirmed: bool,
+    debug: bool,
+):
+    """Copies a model implementation, adapting to a new name."""
+    from .._copy_model import copy_model_files
+
+    copy_model_files(
+        model_name=model_name,
+        label=label,
+        new_name=new_name,
+        target_project=target_project,
+        postprocess=dict(enabled=postprocess),
+        dry_run=dry_run,
+        skip_exts=skip_exts,
+        prompts_confirmed=prompts_confirmed,
+        raise_exc=debug,
+        _log=Echo,
+    )
@@ -0,0 +1,43 @@
+"""Implements the `utopya models edit` subcommand"""
+
+import os
+import sys
+
+import click
+
+from .._shared import complete_model_names
+from .._utils import Echo
+
+
+@click.command(help="Edit the model registry entry")
+@click.argument("model_name", shell_complete=complete_model_names)
+def edit(*, model_name: str):
+    """Edits the model registry entry of the given model"""
+    import utopya
+
+    Echo.progress(
+        f"Opening '{model_name}' model's registry file for editing ..."
+    )
+    Echo.caution("Take care not to corrupt the file!")
+    if not click.confirm("Open file for editing?"):
+        Echo.info("Not opening.")
+        sys.exit(0)
+
+    # Get the filename
+    try:
+        filename = utopya.MODELS[model_name].registry_file_path
+
+    except:
+        filename = os.path.join(
+            utopya.MODELS.registry_dir, f"{model_name}.yml"
+        )
+
+    # Now edit
+    try:
+        click.edit(filename=filename, extension=".yml")
+
+    except Exception as exc:
+        Echo.error("Editing model registry file failed!", error=exc)
+        sys.exit(1)
+
+    Echo.success(f"Successfully edited registry file of '{model_name}' model.")
@@ -0,0 +1,45 @@
+"""Implements the `utopya models info` subcommand"""
+
+import click
+
+from .._shared import OPTIONS, add_options, complete_model_names
+
+# TODO Expand to show more information
+
+
+@click.command(
+    help=(
+        "Shows model information.\n"
+        "\n"
+        "Currently, this only shows the available configuration set names."
+    )
+)
+@click.argument("model_name", shell_complete=complete_model_names)
+@add_options(OPTIONS["label"])
+def info(*, model_name: str, label: str):
+    import utopya
+    from utopya.tools import make_columns
+
+    _log = utopya._getLogger("utopya_cli")
+
+    model = utopya.Model(name=model_name, bundle_label=label)
+
+    _log.progress("Fetching available config sets ...\n")
+    cfg_sets = model.default_config_sets
+    if cfg_sets:
+        _log.note(
+            "Have %d config sets available for model '%s':\n%s",
+            len(cfg_sets),
+            model.name,
+            make_columns(cfg_sets),
+        )
+
+    else:
+        _log.note(
+            "There are no config sets available for model '%s'.", model.name
+        )
+
+    _log.remark(
+        "To add config sets, create subdirectories containing run.yml and/or "
+        "eval.yml files in one of the search directories listed above.",
+    )
@@ -0,0 +1,113 @@
+"""Implements the `utopya models ls` subcommand"""
+
+import glob
+import hashlib
+import os
+import sys
+
+import click
+
+from .._shared import (
+    OPTIONS,
+    UTOPYA_CACHE_DIR,
+    UTOPYA_CFG_SUBDIRS,
+    add_options,
+)
+
+LS_CACHE_DIR: str = os.path.join(UTOPYA_CACHE_DIR, "ls")
+"""Where the rendered output of ``utopya models ls`` is cached"""
+
+
+def _registry_state(registry_dir: str) -> str:
+    """Returns a string that changes whenever the content of the model registry
+    directory changes: the number of registry files, their latest
+    modification time, and the modification time of the directory itself,
+    which changes upon adding or removing files.
+    """
+    mtimes = [
+        os.stat(p).st_mtime_ns
+        for p in glob.glob(os.path.join(registry_dir, "*.y*ml"))
+    ]
+    dir_mtime = os.stat(registry_dir).st_mtime_ns
+    return f"{len(mtimes)}:{max(mtimes, default=0)}:{dir_mtime}"
+
+
+def _write(output: str):
+    """Writes the output to stdout. If stdout is not a terminal, the encoded
+    output is written to the underlying binary buffer directly, skipping the
+    checks :py:func:`click.echo` carries out; the output contains no styling
+    that would need to be stripped.
+    """
+    stdout = sys.stdout
+    if stdout.isatty() or not hasattr(stdout, "buffer"):
+        click.echo(output, nl=False)
+        return
+
+    stdout.flush()
+    stdout.buffer.write(output.encode(stdout.encoding or "utf8", "replace"))
+    stdout.buffer.flush()
+
+
+@click.command(
+    name="ls",
+    help="Lists all registered models",
+)
+@add_options(OPTIONS["long_mode"])
+def list_models(long_mode: bool):
+    # The rendered output is cached, keyed by the state of the registry
+    # directory; on a cache hit, utopya need not be imported at all.
+    # The state is determined *before* rendering, such that changes to the
+    # registry during rendering invalidate the cache.
+    registry_dir = UTOPYA_CFG_SUBDIRS["models"]
+    cache_file = os.path.join(
+        LS_CACHE_DIR,
+        "{}_{}.txt".format(
+            "long" if long_mode else "short",
+            hashlib.sha1(registry_dir.encode("utf8")).hexdigest(),
+        ),
+    )
+    try:
+        key = _registry_state(registry_dir)
+
+    except OSError:
+        key = None
+
+    try:
+        with open(cache_file) as f:
+            cached_key, cached_output = f.read().split("\n", 1)
+
+    except (OSError, ValueError):
+        cached_key = None
+
+    if key is not None and key == cached_key:
+        _write(cached_output)
+        return
+
+    # Need to render it anew
+    import utopya
+
+    if long_mode:
+        blocks = []
+        for block in utopya.MODELS.info_iter_detailed():
+            _write(block + "\n")
+            blocks.append(block)
+        output = "\n".join(blocks)
+
+    else:
+        output = utopya.MODELS.info_str
+        _write(output + "\n")
+
+    # Only cache the output if all entries could be loaded, such that the
+    # corresponding error messages are shown again on the next invocation
+    if key is None or utopya.MODELS._load_errors:
+        return
+
+    try:
+        os.makedirs(LS_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            f.write(f"{key}\n{output}\n")
+        os.replace(tmp_file, cache_file)
+
+    except OSError:
+        pass
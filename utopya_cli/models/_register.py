@@ -0,0 +1,17 @@
+"""Implements the `utopya models register` subcommand tree"""
+
+from .._utils import LazyGroup
+
+register = LazyGroup(
+    name="register",
+    help="Register new models, either individually or in a batch.",
+    lazy_subcommands={
+        "single": "utopya_cli.models._register_single:register_single",
+        "from-list": (
+            "utopya_cli.models._register_from_list:register_from_list"
+        ),
+        "from-manifest": (
+            "utopya_cli.models._register_from_manifest:register_from_manifest"
+        ),
+    },
+)
@@ -0,0 +1,215 @@
+"""Implements the `utopya models register from-list` subcommand"""
+
+import string
+import sys
+from typing import Callable, List, Sequence
+
+import click
+
+from .._shared import OPTIONS, add_options
+from .._utils import Echo, HelpKeyOption
+
+
+def _compile_fstr(fstr: str) -> Callable[[str], str]:
+    """Parses a format string once and returns a callable that renders it for
+    a single model name, avoiding to re-parse the template for every model.
+
+    Templates that contain fields other than ``model_name`` or that use
+    conversions or format specs are rendered via :py:meth:`str.format_map`.
+
+    Args:
+        fstr (str): The format string, containing ``{model_name}`` fields
+    """
+    parts = list(string.Formatter().parse(fstr))
+
+    if any(
+        field not in (None, "model_name") or conv or spec
+        for _, field, spec, conv in parts
+    ):
+        return lambda m: fstr.format_map({"model_name": m})
+
+    def render(model_name: str) -> str:
+        return "".join(
+            literal + (model_name if field is not None else "")
+            for literal, field, _, _ in parts
+        )
+
+    return render
+
+
+def _evaluate_fstr_for_list(
+    *, fstr: str, model_names: Sequence[str]
+) -> List[str]:
+    """Evaluates a format string using the information from a list of model
+    names.
+
+    Args:
+        fstr (str): The format string to evaluate for each model name
+        model_names (Sequence[str]): The (already split) model names
+    """
+    render = _compile_fstr(fstr)
+    return [render(m) for m in model_names]
+
+
+def _exclusive_with(other: str) -> Callable:
+    """Creates a click callback that raises a :py:class:`click.UsageError` if
+    both the option it is attached to and the ``other`` option are given.
+
+    As parameters are processed one after the other, the check is carried
+    out by whichever of the two options is processed last.
+    """
+
+    def callback(ctx: click.Context, param: click.Parameter, value):
+        if value and ctx.params.get(other):
+            opt = param.opts[0]
+            other_opt = "--" + other.replace("_", "-")
+            raise click.UsageError(
+                f"Arguments {opt} and {other_opt} are mutually exclusive! "
+                "Make sure to only pass one of them.",
+                ctx=ctx,
+            )
+        return value
+
+    return callback
+
+
+@click.command(
+    name="from-list",
+    help=(
+        "Register multiple models by providing aligned lists of their names, "
+        "the paths to their executables and their source directories. "
+        "Any additional information is attempted to be extracted from the "
+        "corresponding model source directory or a potentially existing model "
+        "information file.\n"
+        "Note that the arguments need to be separable lists, where the "
+        "``--separator`` argument determines the separation string. "
+        "Also, arguments probably need to be put into quotes and spaces need "
+        "to be escaped."
+    ),
+)
+@click.argument("model_names", type=click.STRING)
+@click.option(
+    "--executables",
+    type=click.STRING,
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "executables"),
+    callback=_exclusive_with("executable_fstr"),
+)
+@click.option(
+    "--source-dirs",
+    type=click.STRING,
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "source_dirs"),
+    callback=_exclusive_with("source_dir_fstr"),
+)
+@click.option(
+    "--base-executable-dir",
+    type=click.Path(file_okay=False, exists=True, resolve_path=True),
+    help="If given, relative executable paths are interpreted against this.",
+)
+@click.option(
+    "--base-source-dir",
+    type=click.Path(file_okay=False, exists=True, resolve_path=True),
+    help=(
+        "If given, relative source directory paths are interpreted against "
+        "this."
+    ),
+)
+@click.option(
+    "--executable-fstr",
+    type=click.STRING,
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "executable_fstr"),
+    callback=_exclusive_with("executables"),
+)
+@click.option(
+    "--source-dir-fstr",
+    type=click.STRING,
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "source_dir_fstr"),
+    callback=_exclusive_with("source_dirs"),
+)
+@click.option(
+    "--py-tests-dir-fstr",
+    type=click.STRING,
+    help="A format string to set the model's python tests directory.",
+)
+@click.option(
+    "--py-plots-dir-fstr",
+    type=click.STRING,
+    help="A format string to set the model's python plots directory.",
+)
+@click.option(
+    "--separator",
+    default=";",
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "separator"),
+)
+@click.option(
+    "--label",
+    type=click.STRING,
+    default="set_via_cli",
+    cls=HelpKeyOption,
+    help_key=("register_from_list", "label"),
+)
+@click.option(
+    "--project-name",
+    type=click.STRING,
+    default=None,
+    help="Name of the project these models are part of.",
+)
+@add_options(OPTIONS["register"])
+def register_from_list(
+    *,
+    model_names: str,
+    label: str,
+    executables: str,
+    source_dirs: str,
+    executable_fstr: str,
+    source_dir_fstr: str,
+    separator: str,
+    set_as_default: bool,
+    exists_action: str,
+    project_name: str,
+    **more_paths,
+):
+    model_names = model_names.split(separator)
+
+    if executable_fstr:
+        executables = _evaluate_fstr_for_list(
+            model_names=model_names, fstr=executable_fstr
+        )
+
+    elif not executables:
+        Echo.error("Missing argument --executables or --executable-fstr!")
+        sys.exit(1)
+
+    if source_dir_fstr:
+        source_dirs = _evaluate_fstr_for_list(
+            model_names=model_names, fstr=source_dir_fstr
+        )
+
+    # Everything ok, can start registering
+    import utopya
+    from utopya.model_registry._registration import register_models_from_list
+
+    try:
+        with Echo.buffered(flush_every=10):
+            register_models_from_list(
+                registry=utopya.MODELS,
+                model_names=model_names,
+                label=label,
+                executables=executables,
+                source_dirs=source_dirs,
+                separator=separator,
+                more_paths=more_paths,
+                project_name=project_name,
+                set_as_default=set_as_default,
+                extract_model_info=True,
+                exists_action=exists_action,
+                _log=Echo,
+            )
+
+    except Exception as exc:
+        Echo.error("Registration failed!", error=exc)
+        sys.exit(1)
@@ -0,0 +1,307 @@
+"""Implements the `utopya models register from-manifest` subcommand"""
+
+import os
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import click
+
+from .._shared import OPTIONS, add_options
+from .._utils import Echo, load_yml_cached
+
+
+def _load_manifests(manifest_files: Sequence[str]) -> List[dict]:
+    """Loads the given manifest files, one after the other.
+
+    Manifest files are small, such that the overhead of a worker pool would
+    outweigh the parsing time, and loading them in this process fills the
+    in-memory cache of :py:func:`~utopya_cli._utils.load_yml_cached`.
+    The YAML parser is not thread-safe, which rules out a thread pool.
+
+    Args:
+        manifest_files (Sequence[str]): The manifest files to load
+
+    Returns:
+        List[dict]: The content of the manifest files, in the same order
+    """
+    return [load_yml_cached(f) for f in manifest_files]
+
+
+def _peek_model_name(manifest_file: str) -> Optional[str]:
+    """Deduces the model name from the name of a manifest file without
+    loading it, following the ``<model_name>_info.yml`` convention.
+
+    Returns:
+        Optional[str]: The model name or None, if the file name does not
+            follow the convention.
+    """
+    fname = os.path.basename(manifest_file)
+    if fname.endswith("_info.yml") and len(fname) > len("_info.yml"):
+        return fname[: -len("_info.yml")]
+    return None
+
+
+def _registered_from(
+    manifest_file: str, *, model_name: str, label: str
+) -> bool:
+    """Whether the model registry already contains an info bundle with the
+    given label for the given model that was registered from the given
+    manifest file.
+
+    Args:
+        manifest_file (str): The (absolute) path to the manifest file
+        model_name (str): The name of the model to look for
+        label (str): The label of the info bundle to look for
+    """
+    import utopya
+
+    if model_name not in utopya.MODELS:
+        return False
+
+    entry = utopya.MODELS[model_name]
+    if label not in entry:
+        return False
+
+    return entry[label].paths.get("model_info") == manifest_file
+
+
+def _prepare_from_manifest(
+    manifest_file: str,
+    *,
+    exists_action: str,
+    bundle_kwargs: dict = None,
+    set_as_default: bool = False,
+    custom_project_name: str = None,
+    custom_label: str = None,
+    custom_model_name: str = None,
+) -> Tuple[str, dict]:
+    """Prepares the registration of a single model from a manifest file.
+
+    If ``bundle_kwargs`` are given, these are used as the (already loaded)
+    manifest file content instead of loading it from ``manifest_file``.
+
+    Returns:
+        Tuple[str, dict]: The model name and the arguments to register the
+            info bundle with.
+    """
+    if bundle_kwargs is None:
+        bundle_kwargs = load_yml_cached(manifest_file)
+
+    # Handle custom model name, label, or project name
+    model_name = bundle_kwargs.pop("model_name")
+    if custom_model_name:
+        Echo.note(f"Using custom model name:     {custom_model_name}")
+        model_name = custom_model_name
+    else:
+        Echo.note(f"Model name:                  {model_name}")
+
+    label = bundle_kwargs.pop("label", "from_manifest_file")
+    if custom_label:
+        Echo.note(f"Using custom label:          {custom_label}")
+        label = custom_label
+    else:
+        Echo.note(f"Label:                       {label}")
+
+    Echo.note(f"Setting as default?          {set_as_default}")
+
+    project_name = bundle_kwargs.pop("project_name", None)
+    if custom_project_name:
+        Echo.note(f"Using custom project name:   {custom_project_name}")
+        project_name = custom_project_name
+
+    # Also add path to manifest file in the paths dict, such that the
+    # info bundle knows about it.
+    bundle_kwargs.setdefault("paths", dict())["model_info"] = manifest_file
+
+    return model_name, dict(
+        label=label,
+        project_name=project_name,
+        exists_action=exists_action,
+        extract_model_info=False,  # already done above
+        set_as_default=set_as_default,
+        **bundle_kwargs,
+    )
+
+
+def _register_from_manifest(manifest_file: str, **kwargs) -> Tuple[str, str]:
+    """Registers a single model from a manifest file.
+
+    Args:
+        manifest_file (str): The manifest file to register the model from
+        **kwargs: Passed on to :py:func:`._prepare_from_manifest`
+
+    Returns:
+        Tuple[str, str]: The model name and the label of the info bundle
+    """
+    import utopya
+
+    model_name, bundle_kwargs = _prepare_from_manifest(manifest_file, **kwargs)
+    utopya.MODELS.register_model_info(model_name, **bundle_kwargs)
+
+    return model_name, bundle_kwargs["label"]
+
+
+@click.command(
+    name="from-manifest",
+    help=(
+        "Register one or many models using manifest files: YAML files that "
+        "contains all relevant model information; see documentation for a "
+        "valid manifest file format."
+    ),
+)
+@click.argument(
+    "manifest_files",
+    nargs=-1,
+    # NOTE Existence is not checked here, as the files are opened anyway
+    type=click.Path(dir_okay=False, resolve_path=True),
+)
+@click.option(
+    "--model-name",
+    "custom_model_name",
+    type=click.STRING,
+    default=None,
+    help=(
+        "If only a single manifest file is given, this option can be used to "
+        "specify the model name, ignoring the one given in the manifest file."
+    ),
+)
+@click.option(
+    "--label",
+    "custom_label",
+    type=click.STRING,
+    default=None,
+    help=(
+        "If given, this label will be used instead of the one given in the "
+        "manifest file(s). "
+        "If no custom label is given and the manifest file does not define "
+        "one either, the default will be ``from_manifest_file``."
+    ),
+)
+@click.option(
+    "--project-name",
+    "custom_project_name",
+    type=click.STRING,
+    default=None,
+    help=(
+        "This option can be used to specify the project name, ignoring the "
+        "name(s) specified in the manifest file(s)."
+    ),
+)
+@add_options(OPTIONS["register"])
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="If set, shows the registered info bundles.",
+)
+def register_from_manifest(
+    *,
+    manifest_files: Tuple[str],
+    custom_model_name: str,
+    set_as_default: bool,
+    custom_project_name: str,
+    custom_label: str,
+    exists_action: str,
+    verbose: bool,
+):
+    """Registers one or many models using manifest files"""
+    num_files = len(manifest_files)
+
+    if custom_model_name and num_files != 1:
+        Echo.error(
+            "A model name can only be specified if only a single "
+            f"manifest file is given (got {num_files}). "
+        )
+        Echo.info(
+            "Either remove the `--model-name` argument or make sure to pass "
+            "only a single manifest file."
+        )
+        sys.exit(1)
+
+    # All checks done, let's go
+    import utopya
+
+    # If existing bundles are to be skipped anyway, there is no need to parse
+    # manifest files that were already registered. The model name is deduced
+    # from the manifest file name; files not following the naming convention
+    # are always parsed. As the label may be defined in the manifest file, it
+    # needs to be given explicitly for this to be possible.
+    if exists_action == "skip" and custom_label:
+        to_register = []
+        for manifest_file in manifest_files:
+            model_name = custom_model_name or _peek_model_name(manifest_file)
+
+            if model_name and _registered_from(
+                manifest_file, model_name=model_name, label=custom_label
+            ):
+                Echo.note("Skipping already registered manifest file:")
+                Echo.remark(f"  {manifest_file}")
+                continue
+            to_register.append(manifest_file)
+
+        manifest_files = tuple(to_register)
+        num_files = len(manifest_files)
+
+        if not manifest_files:
+            Echo.success("All manifest files were already registered.")
+            return
+
+    Echo.info(f"Parsing information from {num_files} manifest file(s) ...")
+
+    try:
+        manifests = _load_manifests(manifest_files)
+
+    except Exception as exc:
+        Echo.error("Loading manifest files failed!", error=exc)
+        sys.exit(1)
+
+    # Prepare registration of all models, then register all at once, such
+    # that each registry file is written only once
+    entries = []
+    progress_fstr = (
+        "\nPreparing model registration from manifest file "
+        f"{{}} / {num_files} ..."
+    )
+    with Echo.buffered(flush_every=10):
+        for i, (manifest_file, bundle_kwargs) in enumerate(
+            zip(manifest_files, manifests), start=1
+        ):
+            Echo.progress(progress_fstr.format(i))
+            Echo.remark("File:  " + manifest_file)
+
+            try:
+                entries.append(
+                    _prepare_from_manifest(
+                        manifest_file,
+                        bundle_kwargs=bundle_kwargs,
+                        custom_model_name=custom_model_name,
+                        set_as_default=set_as_default,
+                        custom_project_name=custom_project_name,
+                        custom_label=custom_label,
+                        exists_action=exists_action,
+                    )
+                )
+
+            except Exception as exc:
+                Echo.error("Registration failed!", error=exc)
+                sys.exit(1)
+
+    Echo.progress(f"\nRegistering {len(entries)} model info bundle(s) ...")
+    try:
+        registered = utopya.MODELS.register_many(entries)
+
+    except Exception as exc:
+        Echo.error("Registration failed!", error=exc)
+        sys.exit(1)
+
+    with Echo.buffered(flush_every=10):
+        for model_name, bundle_kwargs in entries:
+            Echo.info(
+                "Successfully registered model information for "
+                f"'{model_name}'" + (":" if verbose else ".")
+            )
+            if verbose:
+                bundle = registered[model_name][bundle_kwargs["label"]]
+                Echo.remark(utopya.tools.pformat(bundle))
+
+    Echo.success(f"Model information registered successully.")
@@ -0,0 +1,105 @@
+"""Implements the `utopya models register single` subcommand"""
+
+import sys
+
+import click
+
+from .._shared import OPTIONS, add_options, complete_model_names
+from .._utils import Echo
+
+
+@click.command(
+    name="single",
+    help="Register a single new model or update an existing one.",
+)
+@click.argument("model_name", shell_complete=complete_model_names)
+@click.option(
+    "-e",
+    "--executable",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Path to the model executable.",
+)
+@click.option(
+    "--source-dir",
+    default=None,
+    # NOTE Not resolved here, as the info bundle does so anyway
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help=(
+        "Path to the directory that contains the model's source files; "
+        "this can be used to automatically extract model-related information "
+        "like the default model configuration or plot-related configurations."
+    ),
+)
+@click.option(
+    "--default-cfg",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Path to the model's default configuration file.",
+)
+@click.option(
+    "--plots-cfg",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Path to the model's default plots configuration file.",
+)
+@click.option(
+    "--label",
+    type=click.STRING,
+    default="set_via_cli",
+    help=(
+        "Label to identify the info bundle with; if not given, will use a "
+        "default value. This allows registering multiple versions of a model "
+        "under the same name."
+    ),
+)
+@click.option(
+    "--project-name",
+    type=click.STRING,
+    default=None,
+    help="Name of the project this model is part of.",
+)
+@add_options(OPTIONS["register"])
+def register_single(
+    *,
+    model_name: str,
+    executable: str,
+    source_dir: str,
+    default_cfg: str,
+    plots_cfg: str,
+    label: str,
+    set_as_default: bool,
+    project_name: str,
+    exists_action: str,
+):
+    """Registers a new model"""
+    Echo.progress(f"Registering model '{model_name}' (label: '{label}')...")
+    Echo.remark(f"  executable:        {executable}")
+    Echo.remark(f"  source directory:  {source_dir}")
+    Echo.remark(f"  default config:    {default_cfg}")
+    Echo.remark(f"  plots config:      {plots_cfg}")
+
+    import utopya
+
+    try:
+        utopya.MODELS.register_model_info(
+            model_name,
+            label=label,
+            paths=dict(
+                executable=executable,
+                default_cfg=default_cfg,
+                source_dir=source_dir,
+                plots_cfg=plots_cfg,
+            ),
+            project_name=project_name,
+            exists_action=exists_action,
+            set_as_default=set_as_default,
+            extract_model_info=True,
+        )
+
+    except Exception as exc:
+        Echo.error("Registration failed!", error=exc)
+        sys.exit(1)
+
+    else:
+        Echo.success(f"Successully registered model '{model_name}'.")
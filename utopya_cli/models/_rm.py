@@ -0,0 +1,79 @@
+"""Implements the `utopya models rm` subcommand"""
+
+import sys
+
+import click
+
+from .._shared import OPTIONS, add_options, complete_model_names
+from .._utils import Echo
+
+
+@click.command(
+    name="rm",
+    help="Removes info bundles from individual models",
+)
+@click.argument("model_name", shell_complete=complete_model_names)
+@add_options(OPTIONS["label"])
+@click.option(
+    "-a",
+    "--all",
+    "remove_all",
+    is_flag=True,
+    help="If set, removes all info bundles and deletes the registry entry",
+)
+@click.option(
+    "-y",
+    "--yes",
+    "removal_confirmed",
+    is_flag=True,
+    help="If set, skips the confirmation prompt for removing all info bundles",
+)
+def remove_model_or_bundle(
+    *, model_name: str, label: str, remove_all: bool, removal_confirmed: bool
+):
+    # Handle all the cheap interactions first; the registry is only loaded
+    # once it is clear that it will actually be needed.
+    if remove_all:
+        Echo.info(f"Removing registry entry for model '{model_name}'...")
+        if not removal_confirmed and not click.confirm("Are you sure?"):
+            Echo.info("Not removing anything.")
+            sys.exit(0)
+
+        import utopya
+
+        try:
+            utopya.MODELS.remove_entry(model_name)
+
+        except Exception as exc:
+            Echo.error(exc)
+            sys.exit(1)
+
+        Echo.success(f"Registry entry for model '{model_name}' removed.")
+        return
+
+    import utopya
+
+    if not label:
+        try:
+            entry = utopya.MODELS[model_name]
+
+        except Exception as exc:
+            Echo.error(exc)
+            sys.exit(1)
+
+        _avail = ", ".join(entry.keys())
+        Echo.info(f"Available bundles for model '{model_name}':  {_avail}")
+        label = click.prompt("Which bundle would you like to remove?")
+
+    Echo.info(f"Removing info bundle '{label}' for model '{model_name}'...")
+    try:
+        utopya.MODELS.pop_bundle(model_name, label)
+
+    except Exception as exc:
+        Echo.error(exc)
+        sys.exit(1)
+
+    Echo.success(
+        f"Info bundle labelled '{label}' removed "
+        f"from registry entry of model '{model_name}'."
+    )
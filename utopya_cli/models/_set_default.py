@@ -0,0 +1,30 @@
+"""Implements the `utopya models set-default` subcommand"""
+
+import sys
+
+import click
+
+from .._shared import complete_model_names
+from .._utils import Echo
+
+
+@click.command(help="Sets the default info bundle to use for a model")
+@click.argument("model_name", shell_complete=complete_model_names)
+@click.argument("label")
+def set_default(*, model_name: str, label: str):
+    """Sets the default info bundle to use for a certain model"""
+    Echo.progress(
+        f"Setting the info bundle labelled '{label}' as the default "
+        f"for '{model_name}' ..."
+    )
+
+    import utopya
+
+    try:
+        utopya.MODELS.set_default_label(model_name, label)
+
+    except Exception as exc:
+        Echo.error(exc)
+        sys.exit(1)
+
+    Echo.success(f"Successully set default label for model '{model_name}'.")
@@ -0,0 +1,19 @@
+"""Implements the `utopya projects` subcommand tree of the CLI.
+
+The individual subcommands are implemented in their own modules and are only
+imported when they are actually invoked, see
+:py:class:`~utopya_cli._utils.LazyGroup`.
+"""
+
+from .._utils import LazyGroup
+
+projects = LazyGroup(
+    name="projects",
+    help="Show available projects and register new ones.",
+    lazy_subcommands={
+        "ls": "utopya_cli.projects._ls:list_projects",
+        "edit": "utopya_cli.projects._edit:edit",
+        "rm": "utopya_cli.projects._rm:remove",
+        "register": "utopya_cli.projects._register:register",
+    },
+)
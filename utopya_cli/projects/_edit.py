@@ -0,0 +1,50 @@
+"""Implements the `utopya projects edit` subcommand"""
+
+import os
+import sys
+
+import click
+
+from .._shared import UTOPYA_CFG_SUBDIRS, complete_project_names
+from .._utils import Echo
+
+
+@click.command(help="Edit a project's registry file directly.")
+@click.argument("project_name", shell_complete=complete_project_names)
+def edit(project_name: str):
+    """Edits a project registry file"""
+    Echo.progress(
+        f"Opening '{project_name}' project's registry file for editing ..."
+    )
+    Echo.caution("Take care not to corrupt the file!")
+
+    if not click.confirm("Open file for editing?"):
+        Echo.info("Not opening.")
+        sys.exit(0)
+
+    # The registry file path follows from the project name; this also works
+    # for projects that are not loadable. Only if there is no such file, need
+    # the registry to generate a proper error message.
+    filename = os.path.join(
+        UTOPYA_CFG_SUBDIRS["projects"], f"{project_name}.yml"
+    )
+    if not os.path.isfile(filename):
+        from utopya import PROJECTS
+        from utopya.exceptions import MissingEntryError
+
+        try:
+            filename = PROJECTS[project_name].registry_file_path
+
+        except MissingEntryError as err:
+            Echo.error(err)
+            sys.exit(1)
+
+    # Now open for editing
+    try:
+        click.edit(filename=filename, extension=".yml")
+
+    except Exception as exc:
+        Echo.error("Editing project registry file failed!", error=exc)
+        sys.exit(1)
+
+    Echo.success(f"Successfully edited project registry file.")
@@ -0,0 +1,54 @@
+"""Implements the `utopya projects ls` subcommand"""
+
+import click
+
+from .._shared import OPTIONS, add_options
+from .._utils import Echo
+
+
+def _iter_fields(obj):
+    """Yields the names and values of all fields of a schema object that are
+    set, i.e. not None. Uses attribute access instead of dumping the object,
+    such that no (nested) copy of the data is created.
+    """
+    for name in type(obj).model_fields:
+        value = getattr(obj, name)
+        if value is not None:
+            yield name, value
+
+
+@click.command(
+    name="ls",
+    help="Lists all registered projects.",
+)
+@add_options(OPTIONS["long_mode"])
+def list_projects(long_mode: bool):
+    """Lists available projects"""
+    Echo.progress("Loading utopya project list ...")
+
+    from pydantic import BaseModel
+
+    from utopya import PROJECTS
+
+    with Echo.buffered(flush_every=50):
+        Echo.info("\n--- Utopya Projects ---")
+        for project_name, project in PROJECTS.items():
+            Echo.info(f"- {project_name}")
+            if not long_mode:
+                continue
+
+            lines = []
+            for k, v in _iter_fields(project.data):
+                if isinstance(v, BaseModel):
+                    v = dict(_iter_fields(v))
+
+                if isinstance(v, dict):
+                    lines.append(f"  {k:15s}")
+                    lines.extend(
+                        f"    .{sk:12s} : {sv}" for sk, sv in v.items()
+                    )
+                else:
+                    lines.append(f"  {k:15s} : {v}")
+            if lines:
+                Echo.remark("\n".join(lines))
+            Echo.info("")
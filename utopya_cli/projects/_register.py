@@ -0,0 +1,215 @@
+"""Implements the `utopya projects register` subcommand"""
+
+import os
+import sys
+from typing import List
+
+import click
+
+from .._utils import Echo
+
+
+def _find_manifests(models_dir: str) -> List[str]:
+    """Finds model manifest files, i.e. ``*_info.yml`` files, that are located
+    in the direct subdirectories of the given models directory.
+
+    Like a ``<models_dir>/*/*_info.yml`` glob pattern, this ignores hidden
+    directories and files, but avoids pattern matching on each entry.
+
+    Args:
+        models_dir (str): The directory to search in
+
+    Returns:
+        List[str]: Sorted list of manifest file paths
+    """
+    manifest_files = []
+    with os.scandir(models_dir) as model_dirs:
+        for model_dir in model_dirs:
+            if model_dir.name.startswith(".") or not model_dir.is_dir():
+                continue
+
+            with os.scandir(model_dir.path) as entries:
+                manifest_files += [
+                    e.path
+                    for e in entries
+                    if e.name.endswith("_info.yml")
+                    and not e.name.startswith(".")
+                    and e.is_file()
+                ]
+
+    return sorted(manifest_files)
+
+
+@click.command(
+    name="register",
+    help=(
+        "Register a project or validate an existing one.\n"
+        "\n"
+        "Required arguments are the base directory of the project."
+    ),
+)
+@click.argument(
+    "base_dir",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True),
+)
+@click.option(
+    "--info-file",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help=(
+        "A file that contains all additional project information like "
+        "the project name, relevant paths, or other metadata. "
+        "If not given, will search for some candidate files relative to "
+        "``BASE_DIR``, e.g. ``.utopya-project.yml``."
+    ),
+)
+@click.option(
+    "--custom-name",
+    "custom_project_name",
+    type=str,
+    help=(
+        "A custom project name that may differ from the one given in the "
+        "project info file."
+    ),
+)
+@click.option(
+    "--require-matching-names",
+    is_flag=True,
+    help=(
+        "If set, requires that an optionally given ``--custom-name`` and the "
+        "name set in the project info file match exactly."
+    ),
+)
+@click.option(
+    "--exists-action",
+    default="validate",
+    type=click.Choice(("raise", "validate", "overwrite", "update")),
+    help="What to do if a project of the same name is already registered.",
+)
+@click.option(
+    "--with-models",
+    "register_models",
+    is_flag=True,
+    default=False,
+    help=(
+        "If set, will additionally register all models in the project's model "
+        "directory."
+    ),
+)
+@click.option(
+    "--label",
+    "custom_label",
+    type=click.STRING,
+    default=None,
+    help=(
+        "If given, this label will be used instead of the one given in the "
+        "manifest file(s) for model registration. "
+        "If no custom label is given and the manifest file does not define "
+        "one either, the default will be ``from_manifest_file``."
+    ),
+)
+@click.option(
+    "--set-default",
+    "set_as_default",
+    is_flag=True,
+    default=None,
+    help=("Whether to set the registered model(s) as default."),
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="If set, shows the info bundles of the registered models.",
+)
+def register(
+    *,
+    register_models: bool,
+    custom_label: str,
+    set_as_default: bool,
+    exists_action: str,
+    verbose: bool,
+    **kwargs,
+):
+    """Registers a project or validates an existing one.
+
+    This also includes the option to additionally register all models
+    contained in the project's models directory."""
+    from utopya import MODELS, PROJECTS
+    from utopya.tools import pformat
+
+    from ..models._register_from_manifest import (
+        _load_manifests,
+        _register_from_manifest,
+    )
+
+    try:
+        project = PROJECTS.register(exists_action=exists_action, **kwargs)
+
+    except Exception as exc:
+        Echo.error("Project registration failed!", error=exc)
+        sys.exit(1)
+
+    if not register_models:
+        return
+
+    # Look for model info files
+    Echo.progress("\nLooking for models to also be registered ...")
+    models_dir = project.paths.models_dir
+    if not models_dir:
+        Echo.caution(
+            f"Project '{project.project_name}' defines no models directory; "
+            "not registering any models."
+        )
+        Echo.remark("Set `paths.models_dir` in the project info file.")
+        return
+
+    Echo.remark("Models directory:\n  %s", models_dir)
+
+    manifest_files = _find_manifests(models_dir)
+    num_files = len(manifest_files)
+    Echo.note("Found %d manifest file(s).", num_files)
+
+    # Parse all manifest files first, then register them one by one
+    try:
+        manifests = _load_manifests(manifest_files)
+
+    except Exception as exc:
+        Echo.error("Loading manifest files failed!", error=exc)
+        sys.exit(1)
+
+    # Register
+    progress_fstr = (
+        f"\nRegistering model from manifest file {{}} / {num_files} ..."
+    )
+    with Echo.buffered(flush_every=10):
+        for i, (manifest_file, bundle_kwargs) in enumerate(
+            zip(manifest_files, manifests), start=1
+        ):
+            Echo.progress(progress_fstr.format(i))
+            Echo.remark(f"File:  {manifest_file}")
+
+            try:
+                model_name, label = _register_from_manifest(
+                    manifest_file,
+                    bundle_kwargs=bundle_kwargs,
+                    set_as_default=set_as_default,
+                    custom_project_name=project.project_name,
+                    custom_label=custom_label,
+                    exists_action=exists_action,
+                )
+
+            except Exception as exc:
+                Echo.error("Model registration failed!", error=exc)
+                sys.exit(1)
+
+            Echo.info(
+                "Successfully registered model information for "
+                f"'{model_name}'" + (":" if verbose else ".")
+            )
+            if verbose:
+                Echo.remark(pformat(MODELS[model_name][label]))
+
+    Echo.success(
+        f"Project '{project.project_name}' and {num_files} accompanying "
+        "model(s) registered successully."
+    )
@@ -0,0 +1,43 @@
+"""Implements the `utopya projects rm` subcommand"""
+
+import sys
+
+import click
+
+from .._shared import complete_project_names
+from .._utils import Echo
+
+
+@click.command(
+    name="rm",
+    help="Remove a project.",
+)
+@click.argument("project_name", shell_complete=complete_project_names)
+@click.option(
+    "-y",
+    "skip_confirmation",
+    is_flag=True,
+    help="If given, will skip the confirmation prompt.",
+)
+def remove(
+    *,
+    project_name: str,
+    skip_confirmation: bool,
+):
+    """Removes an entry from the project registry file"""
+    from utopya import PROJECTS
+    from utopya.exceptions import MissingEntryError
+
+    Echo.progress(f"Removing project registry entry '{project_name}' ...")
+
+    if not skip_confirmation and not click.confirm("Are you sure?"):
+        Echo.info("Not removing.")
+        sys.exit(0)
+
+    try:
+        PROJECTS.remove_entry(project_name)
+    except MissingEntryError as err:
+        Echo.error(err)
+        sys.exit(1)
+
+    Echo.success(f"Successfully removed project entry '{project_name}'.")
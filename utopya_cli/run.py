@@ -1,10 +1,14 @@
 """Implements the utopya run CLI subtree"""
 
-import os
-
 import click
 
-from ._shared import OPTIONS, add_options, complete_model_names, default_none
+from ._shared import (
+    OPTIONS,
+    NumSteps,
+    add_options,
+    complete_model_names,
+    default_none,
+)
 from ._utils import Echo
 
 
@@ -69,7 +73,7 @@ from ._utils import Echo
     "-N",
     "--num-steps",
     default=None,
-    type=str,
+    type=NumSteps(),
     help=(
         "Sets the number of simulation steps. Needs to be an integer. Metric "
         "suffixes ``(k, M, G, T)`` can be used to denote large numbers, e.g "
@@ -81,7 +85,7 @@ from ._utils import Echo
     "--write-every",
     "--we",
     default=None,
-    type=str,
+    type=NumSteps(),
     help=(
         "Sets the ``write_every`` parameter, controlling how frequently model "
         "data is written. "
@@ -92,7 +96,7 @@ from ._utils import Echo
     "--write-start",
     "--ws",
     default=None,
-    type=str,
+    type=NumSteps(),
     help=(
         "Sets the ``write_start`` parameter, specifying the first time step "
         "at which data is written. After that step, data is written every "
@@ -110,18 +114,7 @@ from ._utils import Echo
         "True, such that a sweep is invoked."
     ),
 )
-@click.option(
-    "-W",
-    "--num-workers",
-    default=None,
-    type=click.IntRange(min=-os.cpu_count() + 1, max=+os.cpu_count()),
-    help=(
-        "Shortcut for meta-config entry ``worker_manager.num_workers``, which "
-        "sets the number of worker processes. "
-        "Can be an integer; if negative, will deduce the number from the "
-        "number of available CPUs."
-    ),
-)
+@add_options(OPTIONS["num_workers"])  # -W, --num-workers
 @click.option(
     "--set-model-params",
     "--mp",
@@ -187,11 +180,12 @@ from ._utils import Echo
 @click.pass_context
 def run(ctx, **kwargs):
     """Invokes a model simulation run and subsequent evaluation"""
+    from dantro.logging import NOTE
+
     import utopya
     from utopya.tools import pformat
 
     from ._utils import parse_run_and_plots_cfg, parse_update_dicts
-    from .eval import _load_and_eval
 
     _log = utopya._getLogger("utopya")  # TODO How best to do this?!
 
@@ -201,7 +195,7 @@ def run(ctx, **kwargs):
         _mode="run", **kwargs, _log=_log
     )
 
-    if update_dict:
+    if update_dict and _log.isEnabledFor(NOTE):
         _log.note("Updates to meta configuration:\n\n%s", pformat(update_dict))
 
     model = utopya.Model(
@@ -237,6 +231,8 @@ def run(ctx, **kwargs):
         return
 
     # Loading and evaluating . . . . . . . . . . . . . . . . . . . . . . . . .
+    from .eval import _load_and_eval
+
     _load_and_eval(
         _log=_log,
         ctx=ctx,
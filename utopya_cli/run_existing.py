@@ -84,6 +84,21 @@ def run_existing(
     **kwargs,
 ):
     """Repeats a model simulation in parts or entirely"""
+    # Check for conflicting arguments before setting anything up
+    if universes and skip_existing_output:
+        raise click.UsageError(
+            "Option --skip-existing cannot be set together "
+            "with a list of universes to perform.",
+            ctx=ctx,
+        )
+
+    elif skip_existing_output and clear_existing_output:
+        raise click.UsageError(
+            "Options --skip-existing and --clear-existing are exclusive "
+            "but both were set.",
+            ctx=ctx,
+        )
+
     import utopya
 
     _log = utopya._getLogger("utopya")
@@ -92,24 +107,12 @@ def run_existing(
     mv = model.create_distributed_mv(run_dir=run_dir)
 
     if universes:
-        if skip_existing_output:
-            raise RuntimeError(
-                "Option --skip-existing cannot be set together "
-                "with a list of universes to perform."
-            )
-
         mv.run_selection(
             uni_id_strs=universes,
             num_workers=num_workers,
             clear_existing_output=clear_existing_output,
         )
     else:
-        if skip_existing_output and clear_existing_output:
-            raise RuntimeError(
-                "Options --skip-existing and --clear-existing are exclusive "
-                "but both were set."
-            )
-
         mv.run(
             num_workers=num_workers,
             clear_existing_output=clear_existing_output,
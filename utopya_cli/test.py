@@ -1,6 +1,8 @@
 """Implements the `utopya test` subcommand"""
 
+import contextlib
 import os
+import shlex
 import sys
 
 import click
@@ -11,6 +13,45 @@ from ._utils import Echo
 # -----------------------------------------------------------------------------
 
 
+@contextlib.contextmanager
+def _prepended_to_sys_path(*paths: str):
+    """Within this context, the given paths are prepended to ``sys.path``.
+
+    Upon exit, exactly the inserted entries are removed again; these are
+    identified by object identity, such that equal entries that were present
+    before or were added by someone else in the meantime are left untouched.
+    """
+    inserted = []
+    for p in paths:
+        sys.path.insert(0, p)
+        inserted.append(p)
+
+    try:
+        yield
+
+    finally:
+        for p in inserted:
+            for i, entry in enumerate(sys.path):
+                if entry is p:
+                    del sys.path[i]
+                    break
+
+
+@contextlib.contextmanager
+def _working_directory(path: str):
+    """Within this context, the working directory is set to ``path``"""
+    old_wd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+
+    finally:
+        os.chdir(old_wd)
+
+
+# -----------------------------------------------------------------------------
+
+
 @click.command(
     "test",
     help=(
@@ -26,6 +67,19 @@ from ._utils import Echo
 # Select a model
 @click.argument("model_name", shell_complete=complete_model_names)
 @add_options(OPTIONS["label"])
+@click.option(
+    "--pytest-cache/--no-pytest-cache",
+    "pytest_cache",
+    default=None,
+    envvar="UTOPYA_PYTEST_CACHE",
+    help=(
+        "Whether pytest may use its cache (``.pytest_cache``), which is "
+        "needed for options like ``--lf``. "
+        "Can also be set via the ``UTOPYA_PYTEST_CACHE`` environment "
+        "variable. If not set, the cache is disabled if the ``CI`` "
+        "environment variable is set, where it would be discarded anyway."
+    ),
+)
 #
 # Pass pytest arguments through
 @click.argument("pytest_args", nargs=-1)
@@ -36,11 +90,10 @@ from ._utils import Echo
 def run_test(
     model_name: str,
     label: str,
+    pytest_cache: bool,
     pytest_args: tuple,
 ):
     """Invokes the associated Python tests for a model using pytest."""
-    import pytest
-
     import utopya
 
     _log = utopya._getLogger("utopya")
@@ -55,33 +108,51 @@ def run_test(
         return
 
     py_tests_dir = os.path.abspath(py_tests_dir)
+    if not os.path.isdir(py_tests_dir):
+        _log.error(
+            "The test directory of this model does not exist:\n  %s",
+            py_tests_dir,
+        )
+        _log.remark(
+            "Check the model's `py_tests_dir` path or re-register the model."
+        )
+        sys.exit(1)
+
+    # Only now, with tests being available, is pytest actually needed
+    try:
+        import pytest
 
-    # Add the model tests' parent directories to the PATH to allow imports
-    prepend_to_sys_path = (
-        os.path.dirname(os.path.dirname(py_tests_dir)),
-        os.path.dirname(py_tests_dir),
-    )
-    for p in prepend_to_sys_path:
-        sys.path.insert(0, p)
+    except ImportError:
+        _log.error("Could not import pytest, which is needed to run tests!")
+        _log.remark(
+            "Install it, e.g. via the test extras:  pip install utopya[test]"
+        )
+        sys.exit(1)
 
-    # Move to the test directory ...
-    old_wd = os.getcwd()
-    os.chdir(py_tests_dir)
+    if pytest_cache is None:
+        pytest_cache = not os.environ.get("CI")
 
-    # ... and invoke the tests
+    if not pytest_cache:
+        pytest_args = tuple(pytest_args) + ("-p", "no:cacheprovider")
+
+    # Add the model tests' parent directories to the PATH to allow imports
+    parent_dir = os.path.dirname(py_tests_dir)
+    prepend_to_sys_path = (os.path.dirname(parent_dir), parent_dir)
+
+    # Temporarily move to the test directory and invoke the tests
     _log.progress("Invoking associated Python model tests ...")
     _log.remark(
         "Temporarily setting working directory to model test directory:\n  %s",
         py_tests_dir,
     )
-    _log.remark("Full test command:\n\n  pytest %s\n\n", " ".join(pytest_args))
-    try:
-        sys.exit(pytest.main(list(pytest_args)))
+    _log.remark(
+        "Full test command:\n\n  pytest %s\n\n", shlex.join(pytest_args)
+    )
 
-    finally:
-        # Change back to previous working directory to not have side effects
-        os.chdir(old_wd)
+    with _prepended_to_sys_path(*prepend_to_sys_path):
+        with _working_directory(py_tests_dir):
+            exit_code = pytest.main(list(pytest_args))
 
-        # Remove previously prependend directories from system PATH
-        for p in prepend_to_sys_path:
-            sys.path.remove(p)
+    # Exit via click, such that the exit code is also available when the CLI
+    # is invoked in non-standalone mode, i.e. without leaving the process
+    click.get_current_context().exit(int(exit_code))